@@ -0,0 +1,21 @@
+"""
+FEATURE TABLE INGEST
+Parses data/raw/steam_games.csv once and writes the canonical feature table
+(data/processed/steam_features.parquet) read by the prepare_*.py scripts
+"""
+
+import time
+
+from feature_table import build_feature_table
+
+print("=" * 60)
+print("FEATURE TABLE INGEST")
+print("=" * 60)
+
+start_time = time.time()
+df = build_feature_table()
+
+print(f"\n📊 Ingested {len(df):,} games in {time.time() - start_time:.1f} seconds")
+print(f"  • Valid release dates: {df['release_year'].notna().sum():,}")
+print(f"  • Games with reviews: {(df['total_reviews'] > 0).sum():,}")
+print("\n✅ Ready for the prepare_*.py scripts!")
@@ -0,0 +1,48 @@
+"""
+Vectorized multi-keyword content filter shared by the data preparation scripts.
+
+All keywords are compiled into one case-insensitive alternation that runs over
+each text column as an Arrow string array, so there is no per-row Python loop.
+The keyword that matched is only extracted for the (few) flagged rows, which
+keeps the filter auditable without slowing it down.
+"""
+
+import re
+
+import pandas as pd
+
+# Adult content keywords (academic suitability filter)
+SEXUAL_KEYWORDS = [
+    'sexual', 'sex', 'nsfw', 'adult', 'nude', 'nudity', 'erotic',
+    'hentai', 'porn', 'xxx', 'mature', '18+', 'explicit'
+]
+
+CONTENT_COLUMNS = ['Tags', 'Genres', 'Categories', 'About the game']
+
+
+def keyword_matches(df, keywords=SEXUAL_KEYWORDS, columns=CONTENT_COLUMNS):
+    """Per-row match report: 'matched' flag plus the first matching keyword and column"""
+    pattern = '|'.join(re.escape(keyword) for keyword in keywords)
+    regex = re.compile(pattern, re.IGNORECASE)
+
+    matched = pd.Series(False, index=df.index)
+    keyword = pd.Series(None, index=df.index, dtype=object)
+    column = pd.Series(None, index=df.index, dtype=object)
+
+    for col in columns:
+        text = df[col].astype('string[pyarrow]')
+        hits = text.str.contains(pattern, case=False, regex=True).fillna(False).astype(bool)
+
+        # Record the first column/keyword that flagged each row
+        new_hits = hits & ~matched
+        keyword[new_hits] = text[new_hits].map(lambda value: regex.search(value).group(0).lower())
+        column[new_hits] = col
+        matched = matched | hits
+
+    return pd.DataFrame({'matched': matched, 'keyword': keyword, 'column': column})
+
+
+def print_match_summary(matches, indent='   '):
+    """Print how many rows each keyword flagged"""
+    for kw, count in matches['keyword'].value_counts().items():
+        print(f"{indent}• {kw}: {count:,}")
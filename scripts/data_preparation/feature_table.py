@@ -0,0 +1,25 @@
+"""
+Shared entry point to the canonical feature table for the prepare_*.py scripts.
+Paths are resolved from the repository root, so scripts work from any directory.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from steam_data import features  # noqa: E402
+
+RAW_CSV = REPO_ROOT / features.RAW_CSV
+FEATURES_PATH = REPO_ROOT / features.FEATURES_PATH
+
+
+def load_features(columns=None):
+    """Read only the requested columns of the feature table"""
+    return features.load_features(columns, path=FEATURES_PATH, csv_path=RAW_CSV)
+
+
+def build_feature_table():
+    """(Re)build the feature table from the raw CSV"""
+    return features.build_feature_table(RAW_CSV, FEATURES_PATH)
@@ -0,0 +1,33 @@
+"""
+DATASET MEMORY REPORT
+Bytes per column of the dashboard dataset with pandas' default dtypes and
+with the compact schema applied by steam_data.schema
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from steam_data import RAW_CSV, apply_schema, memory_report, prepare_dataset  # noqa: E402
+
+print("=" * 60)
+print("DATASET MEMORY REPORT")
+print("=" * 60)
+
+print(f"\n📂 Loading {RAW_CSV}...")
+before = prepare_dataset(pd.read_csv(REPO_ROOT / RAW_CSV))
+after = apply_schema(before)
+report = memory_report(before, after)
+
+report['MB_before'] = report['bytes_before'] / 1e6
+report['MB_after'] = report['bytes_after'] / 1e6
+report['saved'] = report['saved'].map('{:.0%}'.format)
+with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.width', 160, 'display.float_format', '{:.2f}'.format):
+    print(report[['dtype_before', 'MB_before', 'dtype_after', 'MB_after', 'saved']])
+
+total = report.loc['TOTAL']
+print(f"\n✅ {total['MB_before']:.1f} MB -> {total['MB_after']:.1f} MB per copy of the dataset")
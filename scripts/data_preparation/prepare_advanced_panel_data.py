@@ -3,10 +3,11 @@ Prepare preprocessed data files for advanced Octave panels (21-24)
 This creates simplified CSV files that Octave can load instantly
 """
 
-import pandas as pd
 import numpy as np
 import time
 
+from feature_table import load_features
+
 print("="*60)
 print("PREPARING ADVANCED PANEL DATA")
 print("="*60)
@@ -15,7 +16,7 @@ start_time = time.time()
 
 # Load full dataset
 print("\n>>> Loading full dataset (83,560 games)...")
-df = pd.read_csv('../steam_games.csv')
+df = load_features(['Price', 'total_reviews', 'positive_rate'])
 print(f"    Loaded: {len(df)} games, {len(df.columns)} columns")
 
 # =============================================================================
@@ -23,9 +24,8 @@ print(f"    Loaded: {len(df)} games, {len(df.columns)} columns")
 # =============================================================================
 print("\n>>> Preparing Panel 21 data (Scatter: Price vs Rating)...")
 
-# Calculate total reviews and rating
-df['total_reviews'] = df['Positive'] + df['Negative']
-df['rating'] = (df['Positive'] / df['total_reviews'] * 100).fillna(0)
+# Rating (games without reviews count as 0%)
+df['rating'] = df['positive_rate'].fillna(0)
 
 # Filter games with > 10 reviews
 scatter_df = df[df['total_reviews'] > 10].copy()
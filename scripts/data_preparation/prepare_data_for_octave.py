@@ -2,57 +2,33 @@
 import pandas as pd
 import numpy as np
 
+from content_filter import keyword_matches, print_match_summary
+from feature_table import load_features
+
 print("CSV dosyası okunuyor...")
-df = pd.read_csv("steam_games.csv")
+df = load_features([
+    'Name', 'Price', 'Positive', 'Negative', 'positive_rate',
+    'Tags', 'Genres', 'Categories', 'About the game'
+])
 
 print(f"✅ Veri yüklendi: {len(df):,} oyun")
 
-# 1. Başarı metriği oluştur
+# 1. Başarı metriği (positive_rate, yüzde olarak) özellik tablosundan geliyor
 print("\n1. Başarı metriği hesaplanıyor...")
-df['positive_rate'] = df['Positive'] / (df['Positive'] + df['Negative'])
-df['positive_rate'] = df['positive_rate'] * 100  # Yüzde olarak
 
 # 1.5. Cinsel içerik filtresi (akademik uygunluk için)
 print("1.5. Uygunsuz içerik filtreleniyor...")
 initial_count = len(df)
 
-# Tags, Genres, Categories sütunlarında cinsel içerik kontrolü
-sexual_keywords = [
-    'sexual', 'sex', 'nsfw', 'adult', 'nude', 'nudity', 'erotic', 
-    'hentai', 'porn', 'xxx', 'mature', '18+', 'explicit'
-]
-
-# Filtreleme fonksiyonu
-def has_sexual_content(row):
-    text_fields = []
-    
-    # Kontrol edilecek alanları birleştir
-    if pd.notna(row['Tags']):
-        text_fields.append(str(row['Tags']).lower())
-    if pd.notna(row['Genres']):
-        text_fields.append(str(row['Genres']).lower())
-    if pd.notna(row['Categories']):
-        text_fields.append(str(row['Categories']).lower())
-    if pd.notna(row['About the game']):
-        text_fields.append(str(row['About the game']).lower())
-    
-    combined_text = ' '.join(text_fields)
-    
-    # Herhangi bir anahtar kelime var mı?
-    for keyword in sexual_keywords:
-        if keyword in combined_text:
-            return True
-    return False
-
-# Uygunsuz içerik olanları işaretle
-df['has_sexual_content'] = df.apply(has_sexual_content, axis=1)
-filtered_count = df['has_sexual_content'].sum()
+# Tags, Genres, Categories ve "About the game" sütunlarında tek geçişte anahtar kelime taraması
+matches = keyword_matches(df)
+filtered_count = matches['matched'].sum()
 
 # Temiz oyunları seç
-df = df[~df['has_sexual_content']].copy()
-df = df.drop('has_sexual_content', axis=1)
+df = df[~matches['matched']].copy()
 
 print(f"   {filtered_count:,} uygunsuz içerikli oyun kaldırıldı")
+print_match_summary(matches)
 print(f"   {len(df):,} temiz oyun kaldı")
 
 # 2. Minimum review filtrelemesi - KALDIRILDI (tüm veriyi kullan)
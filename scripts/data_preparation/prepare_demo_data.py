@@ -6,9 +6,14 @@ Octave demo için tanınmış yapımcı ve oyunlardan oluşan küçük bir veri
 import pandas as pd
 import numpy as np
 
+from feature_table import load_features
+
 # Ana veriyi yükle
 print("Ana veri yükleniyor...")
-df = pd.read_csv('../../data/raw/steam_games.csv')
+df = load_features([
+    'AppID', 'Name', 'Developers', 'Publishers', 'Main_Developer',
+    'Genres', 'Price', 'Positive', 'Negative'
+])
 print(f"Toplam oyun sayısı: {len(df):,}")
 
 # Bilinen yapımcılar ve yayıncılar
@@ -61,9 +66,7 @@ print(f"Toplam review: {(demo_havuzu['Positive'] + demo_havuzu['Negative']).sum(
 
 # En çok oyunu olan yapımcılar
 print("\nEn çok temsil edilen yapımcılar:")
-df_main_dev = demo_havuzu.copy()
-df_main_dev['Main_Developer'] = df_main_dev['Developers'].str.split(',').str[0].str.strip()
-top_devs = df_main_dev['Main_Developer'].value_counts().head(15)
+top_devs = demo_havuzu['Main_Developer'].value_counts().head(15)
 for dev, count in top_devs.items():
     print(f"  {dev}: {count} oyun")
 
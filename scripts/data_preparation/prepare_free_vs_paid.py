@@ -6,22 +6,20 @@ Compares free and paid games on various metrics
 import pandas as pd
 import numpy as np
 
+from feature_table import load_features
+
 print("=" * 60)
 print("FREE VS PAID GAMES DATA PREPARATION")
 print("=" * 60)
 
 # Load data
-df = pd.read_csv('steam_games.csv')
+df = load_features(['Name', 'Price', 'total_reviews', 'positive_rate', 'Median playtime forever'])
 print(f"\n📊 Loaded {len(df):,} games")
 
 # Filter games with at least 50 reviews for reliability
-df = df[(df['Positive'] + df['Negative']) >= 50].copy()
+df = df[df['total_reviews'] >= 50].copy()
 print(f"✓ With 50+ reviews: {len(df):,} games")
 
-# Calculate metrics
-df['total_reviews'] = df['Positive'] + df['Negative']
-df['positive_rate'] = (df['Positive'] / df['total_reviews'] * 100)
-
 # Categorize by price
 df['is_free'] = df['Price'] == 0
 df['price_category'] = df['is_free'].map({True: 'Free', False: 'Paid'})
@@ -5,8 +5,10 @@ Calculates average price for top 20 most popular genres
 import pandas as pd
 import numpy as np
 
+from feature_table import load_features
+
 print("Loading dataset...")
-df = pd.read_csv('../../data/raw/steam_games.csv')
+df = load_features(['Price', 'genre_list'])
 print(f"Total games: {len(df):,}")
 
 # Clean price data
@@ -18,11 +20,8 @@ print("\nExtracting genres...")
 genre_counts = {}
 genre_prices = {}
 
-for idx, row in df.iterrows():
-    if pd.notna(row['Genres']):
-        genres = [g.strip() for g in str(row['Genres']).split(',')]
-        price = row['Price']
-        
+for genres, price in zip(df['genre_list'], df['Price']):
+    if len(genres) > 0:
         for genre in genres:
             if genre not in genre_counts:
                 genre_counts[genre] = 0
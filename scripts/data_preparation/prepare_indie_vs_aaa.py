@@ -5,19 +5,20 @@ Uses manual studio classification based on known industry categorization
 import pandas as pd
 import numpy as np
 
+from feature_table import load_features
+
 print("Loading full dataset...")
-# Load main dataset
-df = pd.read_csv("../../data/raw/steam_games.csv")
+# Load main dataset (only the columns this analysis and its consumers use)
+df = load_features([
+    'AppID', 'Name', 'Developers', 'Main_Developer', 'Price', 'Positive', 'Negative',
+    'positive_rate', 'total_reviews', 'Median playtime forever', 'DLC count',
+    'Achievements', 'Windows', 'Mac', 'Linux'
+])
 print(f"Total games in dataset: {len(df)}")
+print(f"✓ Main_Developer available for {df['Main_Developer'].notna().sum()} games")
 
-# Create Main_Developer column by extracting first developer
-if 'Developers' in df.columns:
-    df['Main_Developer'] = df['Developers'].str.split(',').str[0].str.strip()
-    print(f"✓ Extracted Main_Developer from {df['Main_Developer'].notna().sum()} games")
-
-# Calculate positive rate and total reviews
-df['positive_rate'] = (df['Positive'] / (df['Positive'] + df['Negative']) * 100).fillna(0)
-df['total_reviews'] = df['Positive'] + df['Negative']
+# Games without reviews count as 0% positive here
+df['positive_rate'] = df['positive_rate'].fillna(0)
 print(f"✓ Calculated ratings and reviews")
 
 # Load studio type mapping
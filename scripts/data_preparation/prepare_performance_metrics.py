@@ -6,22 +6,23 @@ Analyzes successful games and developer performance
 import pandas as pd
 import numpy as np
 
+from feature_table import load_features
+
 print("=" * 60)
 print("PERFORMANCE METRICS DATA PREPARATION")
 print("=" * 60)
 
 # Load data
-df = pd.read_csv('steam_games.csv')
+df = load_features([
+    'Name', 'Developers', 'Main_Developer', 'Price', 'total_reviews', 'positive_rate',
+    'DLC count', 'Median playtime forever', 'platform_count', 'release_year', 'genre_count'
+])
 print(f"\n📊 Loaded {len(df):,} games")
 
 # Filter games with at least 100 reviews for reliability
-df = df[(df['Positive'] + df['Negative']) >= 100].copy()
+df = df[df['total_reviews'] >= 100].copy()
 print(f"✓ With 100+ reviews: {len(df):,} games")
 
-# Calculate metrics
-df['total_reviews'] = df['Positive'] + df['Negative']
-df['positive_rate'] = (df['Positive'] / df['total_reviews'] * 100)
-
 # Calculate popularity score for ranking
 df['popularity_score'] = (
     0.5 * df['positive_rate'] + 
@@ -97,19 +98,16 @@ corr_playtime = spearmanr(df['Median playtime forever'], df['positive_rate'])[0]
 correlation_data.append(('Playtime', corr_playtime * 100))
 
 # 5. Multi-platform support (count of platforms)
-df['platform_count'] = df[['Windows', 'Mac', 'Linux']].sum(axis=1)
 corr_platform = spearmanr(df['platform_count'], df['positive_rate'])[0]
 correlation_data.append(('Platform Count', corr_platform * 100))
 
 # 6. Release Year (newer games)
-df['Release_Year'] = pd.to_datetime(df['Release date'], errors='coerce').dt.year
-df_with_year = df.dropna(subset=['Release_Year'])
+df_with_year = df.dropna(subset=['release_year'])
 if len(df_with_year) > 0:
-    corr_year = spearmanr(df_with_year['Release_Year'], df_with_year['positive_rate'])[0]
+    corr_year = spearmanr(df_with_year['release_year'], df_with_year['positive_rate'])[0]
     correlation_data.append(('Release Year', corr_year * 100))
 
 # 7. Genre diversity (number of genres)
-df['genre_count'] = df['Genres'].str.split(',').str.len()
 corr_genres = spearmanr(df['genre_count'], df['positive_rate'])[0]
 correlation_data.append(('Genre Diversity', corr_genres * 100))
 
@@ -135,9 +133,7 @@ df['is_successful'] = df['popularity_score'] >= df['popularity_score'].quantile(
 # === PANEL 3: DEVELOPER SUCCESS RANKING ===
 print("\n🏆 Panel 3: Top Developers by Success and Popularity")
 
-# Clean developer names - take first developer only (for multi-developer games)
-df['Main_Developer'] = df['Developers'].str.split(',').str[0].str.strip()
-
+# Main_Developer (first listed developer) comes from the feature table
 # Get developers with highest rated and most popular games
 dev_stats = df.groupby('Main_Developer').agg({
     'Name': 'count',
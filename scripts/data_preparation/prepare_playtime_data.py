@@ -2,44 +2,35 @@
 import pandas as pd
 import numpy as np
 
+from content_filter import keyword_matches, print_match_summary
+from feature_table import load_features
+
 print("📊 PLAYTIME ANALYSIS - Data Preparation")
 print("="*60)
 
 # Load main CSV
 print("\n1. Loading data...")
-df = pd.read_csv("steam_games.csv")
+df = load_features([
+    'Tags', 'Genres', 'Categories', 'About the game',
+    'total_reviews', 'positive_rate', 'Median playtime forever'
+])
 print(f"   ✅ {len(df):,} games loaded")
 
 # Filter: Sexual content removal (reuse previous logic)
 print("\n2. Filtering inappropriate content...")
-sexual_keywords = [
-    'sexual', 'sex', 'nsfw', 'adult', 'nude', 'nudity', 'erotic', 
-    'hentai', 'porn', 'xxx', 'mature', '18+', 'explicit'
-]
-
-def has_sexual_content(row):
-    text_fields = []
-    for col in ['Tags', 'Genres', 'Categories', 'About the game']:
-        if pd.notna(row[col]):
-            text_fields.append(str(row[col]).lower())
-    combined = ' '.join(text_fields)
-    return any(kw in combined for kw in sexual_keywords)
-
-df['has_sexual'] = df.apply(has_sexual_content, axis=1)
-filtered = df['has_sexual'].sum()
-df = df[~df['has_sexual']].copy()
-df = df.drop('has_sexual', axis=1)
+matches = keyword_matches(df)
+filtered = matches['matched'].sum()
+df = df[~matches['matched']].copy()
 print(f"   ✅ {filtered:,} inappropriate games removed")
+print_match_summary(matches)
 print(f"   ✅ {len(df):,} clean games remain")
 
-# Calculate positive rate
+# Success metrics (positive_rate) come precomputed from the feature table
 print("\n3. Calculating success metrics...")
-df['positive_rate'] = df['Positive'] / (df['Positive'] + df['Negative'])
-df['positive_rate'] = df['positive_rate'] * 100
 
 # Filter: Minimum 50 reviews
 print("\n4. Filtering by review count (min 50)...")
-df_filtered = df[(df['Positive'] + df['Negative']) >= 50].copy()
+df_filtered = df[df['total_reviews'] >= 50].copy()
 print(f"   ✅ {len(df_filtered):,} games with sufficient reviews")
 
 # Clean playtime data
@@ -7,33 +7,33 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from feature_table import load_features
+
 print("=" * 60)
 print("TIME SERIES DATA PREPARATION")
 print("=" * 60)
 
-# Load data
-df = pd.read_csv('steam_games.csv')
+# Load data (dates are already parsed in the feature table)
+df = load_features([
+    'Name', 'Release date', 'release_year', 'release_month', 'release_quarter',
+    'Price', 'Positive', 'Negative', 'total_reviews', 'positive_rate',
+    'Median playtime forever', 'Windows', 'Mac', 'Linux', 'Genres'
+])
 print(f"\n📊 Loaded {len(df):,} games")
 
-# Parse dates
-df['Release date'] = pd.to_datetime(df['Release date'], errors='coerce')
 df_time = df.dropna(subset=['Release date']).copy()
 print(f"✓ Valid dates: {len(df_time):,} games ({len(df_time)/len(df)*100:.1f}%)")
 
-# Extract time components
-df_time['release_year'] = df_time['Release date'].dt.year
-df_time['release_month'] = df_time['Release date'].dt.month
-df_time['release_quarter'] = df_time['Release date'].dt.quarter
+# Time components are whole numbers once undated games are dropped
+for col in ['release_year', 'release_month', 'release_quarter']:
+    df_time[col] = df_time[col].astype(int)
 
 # Filter to reasonable years (1995-2024)
 df_time = df_time[(df_time['release_year'] >= 1995) & (df_time['release_year'] <= 2024)]
 print(f"✓ Filtered to 1995-2024: {len(df_time):,} games")
 
-# Calculate positive rate
-df_time['positive_rate'] = (df_time['Positive'] / (df_time['Positive'] + df_time['Negative']) * 100)
-
 # Filter games with at least 50 reviews
-df_time = df_time[(df_time['Positive'] + df_time['Negative']) >= 50]
+df_time = df_time[df_time['total_reviews'] >= 50]
 print(f"✓ With 50+ reviews: {len(df_time):,} games")
 
 # === PANEL 1: YEARLY STATISTICS ===
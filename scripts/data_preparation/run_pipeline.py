@@ -0,0 +1,292 @@
+"""
+DATA PREPARATION PIPELINE RUNNER
+Runs the data preparation scripts as a DAG: every stage declares its code,
+inputs and outputs (relative to the repository root), is skipped when the
+hash of those is unchanged since its last successful run, and independent
+stages run in parallel.
+
+Usage:
+    python scripts/data_preparation/run_pipeline.py                 # refresh everything
+    python scripts/data_preparation/run_pipeline.py studio_panels   # one stage + upstream
+    python scripts/data_preparation/run_pipeline.py --force --jobs 4
+    python scripts/data_preparation/run_pipeline.py --dry-run
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from feature_table import REPO_ROOT
+
+SCRIPTS = 'scripts/data_preparation'
+PROCESSED = 'data/processed'
+FEATURES = f'{PROCESSED}/steam_features.parquet'
+STATE_FILE = f'{PROCESSED}/.pipeline_state.json'
+
+# Code every feature-table reader depends on
+FEATURE_CODE = [f'{SCRIPTS}/feature_table.py']
+
+# name -> script, working directory, extra code, inputs, outputs
+STAGES = {
+    'ingest': {
+        'script': 'build_feature_table.py',
+        'cwd': SCRIPTS,
+        'code': FEATURE_CODE + ['steam_data/features.py', 'steam_data/dataset.py'],
+        'inputs': ['data/raw/steam_games.csv'],
+        'outputs': [FEATURES],
+    },
+    'time_series': {
+        'script': 'prepare_time_data.py',
+        'cwd': PROCESSED,
+        'code': FEATURE_CODE,
+        'inputs': [FEATURES],
+        'outputs': [f'{PROCESSED}/time_panel1_yearly.csv', f'{PROCESSED}/time_panel2_platforms.csv',
+                    f'{PROCESSED}/time_panel3_monthly.csv', f'{PROCESSED}/time_panel4_genres.csv',
+                    f'{PROCESSED}/time_panel4_genres_named.csv', f'{PROCESSED}/time_genre_mapping.txt'],
+    },
+    'performance': {
+        'script': 'prepare_performance_metrics.py',
+        'cwd': PROCESSED,
+        'code': FEATURE_CODE,
+        'inputs': [FEATURES],
+        'outputs': [f'{PROCESSED}/performance_panel1_characteristics.csv',
+                    f'{PROCESSED}/performance_panel2_factors.csv',
+                    f'{PROCESSED}/performance_panel3_developers.csv',
+                    f'{PROCESSED}/performance_panel4_top_games.csv'],
+    },
+    'free_vs_paid': {
+        'script': 'prepare_free_vs_paid.py',
+        'cwd': PROCESSED,
+        'code': FEATURE_CODE,
+        'inputs': [FEATURES],
+        'outputs': [f'{PROCESSED}/free_vs_paid_scores.csv', f'{PROCESSED}/free_vs_paid_playtime.csv',
+                    f'{PROCESSED}/free_vs_paid_summary.csv'],
+    },
+    'playtime': {
+        'script': 'prepare_playtime_data.py',
+        'cwd': PROCESSED,
+        'code': FEATURE_CODE + [f'{SCRIPTS}/content_filter.py'],
+        'inputs': [FEATURES],
+        'outputs': [f'{PROCESSED}/steam_analysis/playtime_data.csv',
+                    f'{PROCESSED}/steam_analysis/playtime_mapping.txt'],
+    },
+    'octave_data': {
+        'script': 'prepare_data_for_octave.py',
+        'cwd': PROCESSED,
+        'code': FEATURE_CODE + [f'{SCRIPTS}/content_filter.py'],
+        'inputs': [FEATURES],
+        'outputs': [f'{PROCESSED}/steam_analysis/octave_data.csv',
+                    f'{PROCESSED}/steam_analysis/category_mapping.txt'],
+    },
+    'advanced_panels': {
+        'script': 'prepare_advanced_panel_data.py',
+        'cwd': PROCESSED,
+        'code': FEATURE_CODE,
+        'inputs': [FEATURES],
+        'outputs': [f'{PROCESSED}/panel21_scatter_data.csv', f'{PROCESSED}/panel22_boxplot_data.csv',
+                    f'{PROCESSED}/panel23_linechart_data.csv', f'{PROCESSED}/panel24_stackedbar_data.csv'],
+    },
+    'genre_pricing': {
+        'script': 'prepare_genre_pricing.py',
+        'cwd': SCRIPTS,
+        'code': FEATURE_CODE,
+        'inputs': [FEATURES],
+        'outputs': [f'{PROCESSED}/genre_pricing.csv'],
+    },
+    'indie_vs_aaa': {
+        'script': 'prepare_indie_vs_aaa.py',
+        'cwd': SCRIPTS,
+        'code': FEATURE_CODE,
+        'inputs': [FEATURES, 'data/mappings/studio_types.csv'],
+        'outputs': [f'{PROCESSED}/indie_vs_aaa_data.csv', f'{PROCESSED}/indie_vs_aaa_summary.csv'],
+    },
+    'successful_games': {
+        'script': 'compare_successful_games.py',
+        'cwd': SCRIPTS,
+        'code': [],
+        'inputs': [f'{PROCESSED}/indie_vs_aaa_data.csv'],
+        'outputs': [f'{PROCESSED}/successful_games_comparison.csv'],
+    },
+    'studio_panels': {
+        'script': 'prepare_studio_panel_data.py',
+        'cwd': SCRIPTS,
+        'code': [],
+        'inputs': [f'{PROCESSED}/successful_games_comparison.csv'],
+        'outputs': [f'{PROCESSED}/studio_panel{i}_data.csv' for i in range(1, 5)],
+    },
+    'demo_data': {
+        'script': 'prepare_demo_data.py',
+        'cwd': SCRIPTS,
+        'code': FEATURE_CODE,
+        'inputs': [FEATURES],
+        'outputs': [f'{PROCESSED}/demo_data.csv'],
+    },
+    'demo_simple': {
+        'script': 'create_simple_data.py',
+        'cwd': SCRIPTS,
+        'code': [],
+        'inputs': [f'{PROCESSED}/demo_data.csv'],
+        'outputs': [f'{PROCESSED}/demo_data_simple.csv', f'{PROCESSED}/demo_data_names.txt'],
+    },
+}
+
+
+def upstream(name):
+    """Stages whose outputs feed directly into the given stage"""
+    inputs = set(STAGES[name]['inputs'])
+    return {other for other, stage in STAGES.items()
+            if other != name and inputs & set(stage['outputs'])}
+
+
+def with_upstream(names):
+    """Requested stages plus everything they (transitively) depend on"""
+    selected, todo = set(), list(names)
+    while todo:
+        name = todo.pop()
+        if name not in selected:
+            selected.add(name)
+            todo.extend(upstream(name))
+    return selected
+
+
+def file_digest(path, state):
+    """SHA-256 of a file, memoized in the state on (size, mtime)"""
+    stat = (REPO_ROOT / path).stat()
+    memo = state.setdefault('_files', {}).get(path)
+    if memo and memo['size'] == stat.st_size and memo['mtime_ns'] == stat.st_mtime_ns:
+        return memo['sha256']
+
+    digest = hashlib.sha256()
+    with open(REPO_ROOT / path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    state['_files'][path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                             'sha256': digest.hexdigest()}
+    return digest.hexdigest()
+
+
+def stage_hash(name, state):
+    """Hash of the stage's code and the current contents of its inputs"""
+    stage = STAGES[name]
+    digest = hashlib.sha256(name.encode())
+    for path in [f"{SCRIPTS}/{stage['script']}"] + stage['code'] + stage['inputs']:
+        digest.update(path.encode())
+        digest.update(file_digest(path, state).encode())
+    return digest.hexdigest()
+
+
+def is_fresh(name, state):
+    """True when the stage's hash matches its last run and all outputs exist"""
+    stage = STAGES[name]
+    if not all((REPO_ROOT / path).exists() for path in stage['outputs'] + stage['inputs']):
+        return False
+    return state.get('stages', {}).get(name) == stage_hash(name, state)
+
+
+def run_stage(name):
+    """Run one stage's script and return (ok, seconds, combined output)"""
+    stage = STAGES[name]
+    cwd = REPO_ROOT / stage['cwd']
+    for path in stage['outputs']:
+        (REPO_ROOT / path).parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, str(REPO_ROOT / SCRIPTS / stage['script'])],
+        cwd=cwd, capture_output=True, text=True
+    )
+    return result.returncode == 0, time.time() - start, result.stdout + result.stderr
+
+
+def load_state():
+    try:
+        return json.loads((REPO_ROOT / STATE_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state):
+    path = REPO_ROOT / STATE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(state, indent=2, sort_keys=True))
+
+
+def run_pipeline(targets=None, force=False, jobs=None, dry_run=False):
+    """Run the selected stages in dependency order; returns the failed stage names"""
+    selected = with_upstream(targets or STAGES)
+    deps = {name: upstream(name) & selected for name in selected}
+    state = load_state()
+
+    done, failed, skipped = set(), set(), set()
+    would_run = set()
+    running = {}
+    jobs = jobs or os.cpu_count() or 1
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while len(done | failed | skipped) < len(selected):
+            # Stages downstream of a failure cannot run
+            for name in selected - done - failed - skipped - set(running.values()):
+                if deps[name] & (failed | skipped):
+                    skipped.add(name)
+                    print(f"⏭️  {name}: skipped (upstream failed)")
+
+            ready = [name for name in sorted(selected - done - failed - skipped - set(running.values()))
+                     if deps[name] <= done]
+            for name in ready:
+                if not force and not deps[name] & would_run and is_fresh(name, state):
+                    done.add(name)
+                    print(f"✓ {name}: up to date")
+                elif dry_run:
+                    done.add(name)
+                    would_run.add(name)
+                    print(f"• {name}: would run")
+                else:
+                    print(f"▶ {name}: running {STAGES[name]['script']}")
+                    running[pool.submit(run_stage, name)] = name
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                ok, seconds, output = future.result()
+                if ok:
+                    done.add(name)
+                    state.setdefault('stages', {})[name] = stage_hash(name, state)
+                    save_state(state)
+                    print(f"✅ {name}: done in {seconds:.1f}s")
+                else:
+                    failed.add(name)
+                    print(f"❌ {name}: failed after {seconds:.1f}s\n{output}")
+
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental data preparation pipeline")
+    parser.add_argument('stages', nargs='*', help="Stages to bring up to date (default: all)")
+    parser.add_argument('--force', action='store_true', help="Rerun stages even if unchanged")
+    parser.add_argument('--jobs', type=int, default=None, help="Parallel stages (default: CPU count)")
+    parser.add_argument('--dry-run', action='store_true', help="Only show what would run")
+    args = parser.parse_args()
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))} (choose from {', '.join(STAGES)})")
+
+    print("=" * 60)
+    print("DATA PREPARATION PIPELINE")
+    print("=" * 60)
+    failed = run_pipeline(args.stages, force=args.force, jobs=args.jobs, dry_run=args.dry_run)
+    print("=" * 60)
+    print("❌ PIPELINE FAILED: " + ", ".join(sorted(failed)) if failed else "✅ PIPELINE COMPLETE")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
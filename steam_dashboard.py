@@ -13,6 +13,13 @@ from datetime import datetime
 import os
 from pathlib import Path
 
+from steam_data import (
+    DEFAULT_WEIGHTS, HEAVY_TAILED, RAW_CSV, AggregateCube, Binner, ContentIndex, DistributionSummaries,
+    FilterEngine, FuzzySearch, GameLookup, GenreCodes, GenreIndex, NameAutocomplete, RangeAggregates, RankIndex,
+    ResultCache, Sampler, ScatterPlanner, SimilarityIndex, TrigramIndex, load_snapshot, rating_scores, source_digest,
+    success_mask, success_scores
+)
+
 # Page configuration
 st.set_page_config(
     page_title="Steam Games Analytics",
@@ -50,26 +57,210 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load data with caching
-@st.cache_data
-def load_data():
-    """Load and prepare Steam games dataset"""
-    df = pd.read_csv('data/raw/steam_games.csv')
-    
-    # Data preprocessing
-    df['Release date'] = pd.to_datetime(df['Release date'], errors='coerce')
-    df['Release_Year'] = df['Release date'].dt.year
-    df['total_reviews'] = df['Positive'] + df['Negative']
-    df['positive_rate'] = (df['Positive'] / df['total_reviews'] * 100).round(2)
-    df['platform_count'] = df[['Windows', 'Mac', 'Linux']].sum(axis=1)
-    
-    # Clean genres
-    df['Genres'] = df['Genres'].fillna('Unknown')
-    df['genre_list'] = df['Genres'].str.split(',')
-    
-    # Developer cleanup
-    df['Main_Developer'] = df['Developers'].str.split(',').str[0].str.strip()
-    
-    return df
+@st.cache_resource
+def load_data(source_hash):
+    """Load the Steam games dataset once per process (memory-mapped from the snapshot cache)
+
+    The frame is shared by every session and must never be modified;
+    page-specific columns live in their own cached arrays.
+    """
+    # source_hash only keys the cache so an edited CSV triggers a reload
+    df, snapshot_status = load_snapshot(RAW_CSV)
+    return df, snapshot_status
+
+@st.cache_resource
+def load_success_scores(source_hash):
+    """Success score per game and the top-10% mask for the Insights page"""
+    df, _ = load_data(source_hash)
+    scores = success_scores(df)
+    return scores, success_mask(scores, 0.9)
+
+@st.cache_resource
+def load_genre_index(source_hash):
+    """Genre bitset index over the rows of load_data(), built once per process"""
+    df, _ = load_data(source_hash)
+    return GenreIndex.from_codes(GenreCodes.from_column(df['genre_list']))
+
+@st.cache_resource
+def load_cube(source_hash):
+    """Year x genre x platform x price aggregate cube, persisted in the snapshot directory"""
+    df, _ = load_data(source_hash)
+    return AggregateCube.load_or_build(df, load_genre_index(source_hash), AggregateCube.cache_path(source_hash))
+
+@st.cache_resource
+def load_filter_engine(source_hash):
+    """Sorted-column indexes for the range, platform and genre filters"""
+    df, _ = load_data(source_hash)
+    return FilterEngine(df, genre_index=load_genre_index(source_hash))
+
+@st.cache_resource
+def load_range_aggregates(source_hash):
+    """Summed-area tables answering the Home summary metrics for slider ranges"""
+    df, _ = load_data(source_hash)
+    return RangeAggregates(df)
+
+@st.cache_resource
+def load_result_cache(source_hash):
+    """LRU cache of Home filter results, shared by every session"""
+    return ResultCache()
+
+@st.cache_resource
+def load_binner(source_hash):
+    """Server-side histogram / KDE binning with its own result cache"""
+    df, _ = load_data(source_hash)
+    return Binner(df)
+
+@st.cache_resource
+def load_distribution_summaries(source_hash):
+    """Precomputed box / violin statistics with their own result cache"""
+    df, _ = load_data(source_hash)
+    return DistributionSummaries(df)
+
+@st.cache_resource
+def load_scatter_planner(source_hash):
+    """Decides between WebGL points and a server-side density grid per scatter"""
+    df, _ = load_data(source_hash)
+    return ScatterPlanner(df)
+
+@st.cache_resource
+def load_sampler(source_hash):
+    """Seeded, stratified chart samples cached per filter state"""
+    df, _ = load_data(source_hash)
+    return Sampler(df)
+
+@st.cache_resource
+def load_rank_index(source_hash):
+    """Presorted leaderboard orders (raw and confidence-adjusted ratings) and developer counts"""
+    df, _ = load_data(source_hash)
+    scores = rating_scores(df)
+    return RankIndex(df, scores=scores), scores
+
+@st.cache_resource
+def load_game_lookup(source_hash):
+    """AppID -> row index and normalized-name -> AppIDs multimap for game pickers"""
+    df, _ = load_data(source_hash)
+    return GameLookup.from_frame(df)
+
+@st.cache_resource
+def load_autocomplete(source_hash):
+    """Sorted case-folded names for review-weighted prefix completion"""
+    df, _ = load_data(source_hash)
+    return NameAutocomplete.from_frame(df)
+
+@st.cache_resource
+def load_text_indexes(source_hash):
+    """Trigram substring indexes over game names and developers"""
+    df, _ = load_data(source_hash)
+    return {
+        'Name': TrigramIndex.from_series(df['Name']),
+        'Developers': TrigramIndex.from_series(df['Developers'])
+    }
+
+@st.cache_resource
+def load_fuzzy_search(source_hash):
+    """Typo-tolerant name search ranked by match quality and review count"""
+    df, _ = load_data(source_hash)
+    return FuzzySearch.from_frame(df)
+
+@st.cache_resource
+def load_similarity_index(source_hash):
+    """Nearest-neighbour index for Find Similar Games"""
+    df, _ = load_data(source_hash)
+    return SimilarityIndex(df, genre_index=load_genre_index(source_hash))
+
+@st.cache_resource
+def load_content_index(source_hash):
+    """TF-IDF tag/description index, persisted in the snapshot directory"""
+    df, _ = load_data(source_hash)
+    return ContentIndex.load_or_build(df, ContentIndex.cache_path(source_hash))
+
+def histogram_figure(hist, title, color, log=False, kde_curve=None):
+    """Bar chart of precomputed histogram counts (only edges and counts reach the browser)"""
+    edges, counts = hist['edges'], hist['counts']
+    if log:
+        # Log-spaced bins are shown as evenly spaced, labelled ranges; edges get
+        # the fewest decimals that keep them distinct (small metrics like Price need some)
+        decimals = next((d for d in range(5) if len(np.unique(np.round(edges, d))) == len(edges)), 4)
+        labels = [f"{lo:,.{decimals}f}–{hi:,.{decimals}f}" for lo, hi in zip(edges[:-1], edges[1:])]
+        fig = go.Figure(go.Bar(x=labels, y=counts, marker_color=color))
+    else:
+        fig = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+            marker_color=color, marker_line_width=0,
+            customdata=np.column_stack([edges[:-1], edges[1:]]),
+            hovertemplate="%{customdata[0]:.2f} – %{customdata[1]:.2f}<br>count: %{y:,}<extra></extra>"
+        ))
+        if kde_curve is not None and len(kde_curve['grid']):
+            # Density scaled to counts per bin
+            scale = counts.sum() * np.diff(edges).mean()
+            fig.add_trace(go.Scatter(
+                x=kde_curve['grid'], y=kde_curve['density'] * scale,
+                mode='lines', line=dict(color='#ff7f0e', width=2), name='KDE'
+            ))
+    fig.update_layout(title=title, bargap=0.02, showlegend=False, yaxis_title='count')
+    return fig
+
+def box_figure(summaries, title, colors=None, violin=False):
+    """Box (or violin) chart from precomputed per-group statistics"""
+    colors = colors or px.colors.qualitative.Plotly
+    fig = go.Figure()
+    for i, (group, stats) in enumerate(summaries.items()):
+        color = colors[i % len(colors)]
+        if violin and len(stats['grid']):
+            # Mirrored KDE outline around the group's position
+            half = stats['density'] / stats['density'].max() * 0.4
+            fig.add_trace(go.Scatter(
+                x=np.concatenate([i - half, (i + half)[::-1]]),
+                y=np.concatenate([stats['grid'], stats['grid'][::-1]]),
+                fill='toself', mode='lines', line=dict(color=color, width=1),
+                opacity=0.5, hoverinfo='skip', name=str(group)
+            ))
+        fig.add_trace(go.Box(
+            x=[i], q1=[stats['q1']], median=[stats['median']], q3=[stats['q3']],
+            lowerfence=[stats['lowerfence']], upperfence=[stats['upperfence']], mean=[stats['mean']],
+            width=0.15 if violin else 0.6, marker_color=color, name=str(group)
+        ))
+        if len(stats['outliers']):
+            fig.add_trace(go.Scatter(
+                x=np.full(len(stats['outliers']), i), y=stats['outliers'],
+                mode='markers', marker=dict(color=color, size=4), name=str(group)
+            ))
+    fig.update_layout(
+        title=title, showlegend=False,
+        xaxis=dict(tickvals=list(range(len(summaries))), ticktext=[str(g) for g in summaries])
+    )
+    return fig
+
+def scatter_figure(frame, plan, x, y, color, size, colorscale, title, log_x=False, log_y=False):
+    """WebGL scatter for moderate counts, density grid plus outlier points past the threshold"""
+    fig = go.Figure()
+    if plan['mode'] == 'density':
+        x_edges = 10 ** plan['x_edges'] if log_x else plan['x_edges']
+        y_edges = 10 ** plan['y_edges'] if log_y else plan['y_edges']
+        counts = np.where(plan['counts'] > 0, plan['counts'], np.nan)
+        fig.add_trace(go.Heatmap(
+            x=x_edges, y=y_edges, z=np.round(np.log10(counts), 3), colorscale='Greys', showscale=False,
+            customdata=counts, hovertemplate="%{customdata:,.0f} games<extra></extra>"
+        ))
+
+    points = frame.iloc[plan['points']]
+    sizes = points[size].to_numpy(dtype=float)
+    sizes = 4 + 16 * np.sqrt(np.nan_to_num(sizes) / max(np.nanmax(sizes, initial=0), 1))
+    fig.add_trace(go.Scattergl(
+        x=points[x], y=points[y], mode='markers',
+        marker=dict(
+            color=points[color], colorscale=colorscale, size=sizes, sizemode='diameter',
+            showscale=True, colorbar=dict(title=color), line=dict(width=0), opacity=0.8
+        ),
+        customdata=points[['Name', 'Main_Developer']].to_numpy(),
+        hovertemplate=f"%{{customdata[0]}}<br>%{{customdata[1]}}<br>{x}: %{{x}}<br>{y}: %{{y}}<extra></extra>"
+    ))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y, showlegend=False)
+    if log_x:
+        fig.update_xaxes(type='log')
+    if log_y:
+        fig.update_yaxes(type='log')
+    return fig
 
 # Sidebar - Navigation
 with st.sidebar:
@@ -91,14 +282,31 @@ with st.sidebar:
     st.markdown("### 🎯 Quick Stats")
     
     # Load data
-    df = load_data()
+    source_hash = source_digest(RAW_CSV)
+    shared_df, snapshot_status = load_data(source_hash)
+    # Copy-on-write view: nothing a page does can leak into other sessions
+    df = shared_df.copy(deep=False)
+    genre_index = load_genre_index(source_hash)
+    cube = load_cube(source_hash)
+    filter_engine = load_filter_engine(source_hash)
+    range_aggregates = load_range_aggregates(source_hash)
+    result_cache = load_result_cache(source_hash)
+    binner = load_binner(source_hash)
+    distributions = load_distribution_summaries(source_hash)
+    scatter_planner = load_scatter_planner(source_hash)
+    sampler = load_sampler(source_hash)
+    # Search, lookup and similarity indexes are loaded by the pages that use them
     
+    catalog = cube.summary().iloc[0]
     st.metric("Total Games", f"{len(df):,}")
-    st.metric("Avg Rating", f"{df['positive_rate'].mean():.1f}%")
-    st.metric("Avg Price", f"${df['Price'].mean():.2f}")
+    st.metric("Avg Rating", f"{catalog['positive_rate_mean']:.1f}%")
+    st.metric("Avg Price", f"${catalog['Price_mean']:.2f}")
+    st.caption(f"Dataset snapshot: {snapshot_status}")
 
 # Main content based on page selection
 if page == "🏠 Home":
+    rank_index, rating_score_arrays = load_rank_index(source_hash)
+    
     st.markdown('<div class="main-header">🎮 Steam Games Analytics Dashboard</div>', unsafe_allow_html=True)
     
     # Welcome message
@@ -160,41 +368,50 @@ if page == "🏠 Home":
             )
         
         with col4:
-            # Get all unique genres
-            all_genres = set()
-            for genres in df['genre_list'].dropna():
-                all_genres.update([g.strip() for g in genres])
-            all_genres = sorted(list(all_genres))
-            
             st.markdown("**🎮 Game Genres**")
             selected_genres = st.multiselect(
                 "Which genres would you like to include?",
-                all_genres,
+                genre_index.genres,
                 default=[],
                 help="Leave empty to include every genre"
             )
+            genre_mode = st.radio(
+                "Genre match",
+                ["Any selected", "All selected"],
+                horizontal=True,
+                help="Any = at least one of the selected genres, All = every selected genre"
+            )
     
-    # Apply filters
-    filtered_df = df[
-        (df['Price'] >= price_range[0]) & 
-        (df['Price'] <= price_range[1]) &
-        (df['total_reviews'] >= min_reviews) &
-        (df['positive_rate'] >= rating_threshold) &
-        (df['Release_Year'] >= year_range[0]) &
-        (df['Release_Year'] <= year_range[1])
-    ]
+    # Apply filters (binary search on presorted columns, genres via bitsets)
+    home_filters = {
+        'Price': price_range,
+        'total_reviews': (min_reviews, None),
+        'positive_rate': (rating_threshold, None),
+        'Release_Year': year_range,
+        'platforms': sorted(platforms),
+        'genres': sorted(selected_genres),
+        'genre_mode': 'all' if genre_mode == "All selected" else 'any'
+    }
     
-    # Platform filter
-    if platforms:
-        platform_filter = filtered_df[platforms].any(axis=1)
-        filtered_df = filtered_df[platform_filter]
+    def compute_home_result():
+        rows = filter_engine.query(home_filters)
+        # Slider-only filters are answered from the summed-area table
+        metrics = range_aggregates.metrics(home_filters)
+        if metrics is None:
+            selected = df.iloc[rows]
+            metrics = {
+                'count': len(rows),
+                'avg_price': selected['Price'].mean(),
+                'avg_rating': selected['positive_rate'].mean(),
+                'total_reviews': selected['total_reviews'].sum(),
+                'avg_playtime': selected['Median playtime forever'].mean()
+            }
+        return {'rows': rows, 'metrics': metrics}
     
-    # Genre filter
-    if selected_genres:
-        genre_filter = filtered_df['genre_list'].apply(
-            lambda x: any(genre in selected_genres for genre in x) if isinstance(x, list) else False
-        )
-        filtered_df = filtered_df[genre_filter]
+    # Row positions and summary metrics are memoized per filter state
+    home_result = result_cache.get_or_compute(home_filters, compute_home_result)
+    filtered_df = df.iloc[home_result['rows']]
+    metrics = home_result['metrics']
     
     if len(filtered_df) == 0:
         st.error("❌ No games found! Loosen the filters and try again.")
@@ -207,15 +424,21 @@ if page == "🏠 Home":
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Filtered Games", f"{len(filtered_df):,}")
+        st.metric("Filtered Games", f"{metrics['count']:,}")
     with col2:
-        st.metric("Avg Price", f"${filtered_df['Price'].mean():.2f}")
+        st.metric("Avg Price", f"${metrics['avg_price']:.2f}")
     with col3:
-        st.metric("Avg Rating", f"{filtered_df['positive_rate'].mean():.1f}%")
+        st.metric("Avg Rating", f"{metrics['avg_rating']:.1f}%")
     with col4:
-        st.metric("Total Reviews", f"{filtered_df['total_reviews'].sum():,}")
+        st.metric("Total Reviews", f"{metrics['total_reviews']:,}")
     with col5:
-        st.metric("Avg Playtime", f"{filtered_df['Median playtime forever'].mean():.0f}h")
+        st.metric("Avg Playtime", f"{metrics['avg_playtime']:.0f}h")
+    
+    cache_stats = result_cache.stats()
+    st.caption(
+        f"Filter cache: {cache_stats['hit_rate']:.0%} hit rate · {cache_stats['entries']} cached results · "
+        f"{cache_stats['evictions']} evictions"
+    )
     
     st.markdown("---")
     
@@ -228,15 +451,12 @@ if page == "🏠 Home":
     with col1:
         st.markdown("#### 💰 Price vs Rating Relationship")
         st.caption("Bubble size = review count | Color = rating")
-        fig1 = px.scatter(
-            filtered_df.sample(min(1000, len(filtered_df))),
-            x='Price',
-            y='positive_rate',
-            size='total_reviews',
-            color='positive_rate',
-            hover_data=['Name', 'Main_Developer'],
-            color_continuous_scale='RdYlGn',
-            title="Price vs Rating (bubble size = reviews)"
+        # Every filtered game: WebGL points, or a density grid plus outliers for large sets
+        fig1 = scatter_figure(
+            df,
+            scatter_planner.plan('Price', 'positive_rate', rows=home_result['rows'], filters=home_filters),
+            'Price', 'positive_rate', 'positive_rate', 'total_reviews', 'RdYlGn',
+            "Price vs Rating (bubble size = reviews)"
         )
         fig1.update_layout(height=400)
         st.plotly_chart(fig1, width='stretch')
@@ -256,8 +476,17 @@ if page == "🏠 Home":
     
     # Top games
     st.markdown("### 🏆 Top 10 Games by Rating")
-    st.caption("Games with the highest positive review share under the current filters")
-    top_games = filtered_df.nlargest(10, 'positive_rate')[['Name', 'Main_Developer', 'Price', 'positive_rate', 'total_reviews', 'Median playtime forever']]
+    rating_options = {
+        "Confidence-adjusted (Wilson lower bound)": 'wilson_score',
+        "Bayesian average (50-review prior)": 'bayesian_score',
+        "Raw positive share": 'positive_rate'
+    }
+    rank_by = rating_options[st.selectbox("Rank by", list(rating_options), help="Adjusted scores keep games with only a handful of reviews from topping the list")]
+    st.caption("Games with the highest rating under the current filters")
+    top_rows = rank_index.top_k(rank_by, 10, home_result['rows'])
+    top_games = df.iloc[top_rows][['Name', 'Main_Developer', 'Price', 'positive_rate', 'total_reviews', 'Median playtime forever']]
+    if rank_by != 'positive_rate':
+        top_games.insert(3, 'Score', rating_score_arrays[rank_by][top_rows].round(2))
     st.dataframe(
         top_games.style.background_gradient(subset=['positive_rate'], cmap='RdYlGn'),
         width='stretch',
@@ -265,6 +494,10 @@ if page == "🏠 Home":
     )
 
 elif page == "⚖️ Compare":
+    rank_index, _ = load_rank_index(source_hash)
+    game_lookup = load_game_lookup(source_hash)
+    autocomplete = load_autocomplete(source_hash)
+    
     st.markdown('<div class="main-header">⚖️ Game Comparison</div>', unsafe_allow_html=True)
     
     st.info("""💡 **How to use** 
@@ -272,18 +505,31 @@ elif page == "⚖️ Compare":
     2. Review the comparison table, radar chart, and side-by-side bar charts
     3. See which game performs better on which metric""")
     
-    st.caption("📊 The list shows the top 500 most-reviewed games. Use 'Search Games' for others.")
+    # Prefix completions over the whole catalog; only these and the current picks reach the browser
+    compare_prefix = st.text_input(
+        "🔎 Type the start of a game name",
+        placeholder="e.g., Portal, The Witcher... (empty: most-reviewed games)"
+    )
+    if compare_prefix:
+        suggestion_rows = autocomplete.complete(compare_prefix, k=25)
+        st.caption(f"📊 {autocomplete.count(compare_prefix):,} games start with '{compare_prefix}'; showing the {len(suggestion_rows)} most-reviewed.")
+    else:
+        suggestion_rows = rank_index.top_k('total_reviews', 25)
     
-    # Multi-select for games
-    game_options = df.nlargest(500, 'total_reviews')['Name'].tolist()
+    # Multi-select for games: a stable key keeps the picks while the suggestions change,
+    # and picks outside the current suggestions are appended so they stay valid options
+    suggestion_ids = df['AppID'].iloc[suggestion_rows].tolist()
+    picked = st.session_state.get('compare_games', [])
+    game_options = suggestion_ids + [app_id for app_id in picked if app_id not in suggestion_ids]
     selected_games = st.multiselect(
         "Select games to compare (choose 2-5):",
         game_options,
-        default=[]
+        key='compare_games',
+        format_func=game_lookup.label
     )
     
     if len(selected_games) >= 2:
-        compare_df = df[df['Name'].isin(selected_games)]
+        compare_df = df.iloc[game_lookup.rows(selected_games)]
         
         # Comparison metrics table
         st.markdown("### 📊 Comparison Table")
@@ -377,28 +623,33 @@ elif page == "⚖️ Compare":
         st.info("👆 Select games from the dropdown above to start comparing")
 
 elif page == "🔍 Search Games":
+    fuzzy_search = load_fuzzy_search(source_hash)
+    game_lookup = load_game_lookup(source_hash)
+    
     st.markdown('<div class="main-header">🔍 Search & Details</div>', unsafe_allow_html=True)
     
-    st.info("💡 **How it works:** Start typing a game name below. Matching games will appear and you can view their details.")
+    st.info("💡 **How it works:** Start typing a game name below. The best matches appear first (typos and missing punctuation are fine) and you can view their details.")
     
     # Search box
     search_term = st.text_input("🎮 Type a game name...", placeholder="e.g., Counter-Strike, GTA, Witcher...")
     
     if search_term:
-        # Instant search
-        search_results = df[df['Name'].str.contains(search_term, case=False, na=False)]
+        # Ranked, typo-tolerant search (top 50 matches)
+        matches = fuzzy_search.search(search_term, k=50)
+        search_results = df.iloc[matches['row']]
         
-        st.write(f"Found **{len(search_results)}** games matching '{search_term}'")
+        st.write(f"Top **{len(search_results)}** matches for '{search_term}'")
         
         if len(search_results) > 0:
             # Select game
             selected_game = st.selectbox(
                 "Select a game for details:",
-                search_results['Name'].tolist()
+                search_results['AppID'].tolist(),
+                format_func=game_lookup.label
             )
             
             if selected_game:
-                game_data = search_results[search_results['Name'] == selected_game].iloc[0]
+                game_data = df.iloc[game_lookup.row(selected_game)]
                 
                 # Game detail card
                 col1, col2, col3 = st.columns([2, 1, 1])
@@ -447,6 +698,8 @@ elif page == "🔍 Search Games":
                     st.write(f"**Estimated Owners:** {game_data['Estimated owners']}")
 
 elif page == "📈 Interactive Analysis":
+    rank_index, _ = load_rank_index(source_hash)
+    
     st.markdown('<div class="main-header">📈 Interactive Analysis</div>', unsafe_allow_html=True)
     
     st.info("""💡 **How to use**
@@ -555,10 +808,16 @@ elif page == "📈 Interactive Analysis":
                 )
         
         # Sample size control
-        col1, col2 = st.columns([3, 1])
+        col1, col2, col3 = st.columns([3, 1, 1])
         with col1:
             sample_size = st.slider("Sample Size (for performance)", 100, 10000, 2000)
         with col2:
+            strata_label = st.selectbox(
+                "Stratify sample by",
+                ["None", "Release year", "Price bucket", "Genre"],
+                help="Keep each group's share of the filtered games in the sample"
+            )
+        with col3:
             use_log = st.checkbox("Log Scale", value=False)
         
         # Apply filters
@@ -571,48 +830,38 @@ elif page == "📈 Interactive Analysis":
             with col3:
                 year_filter = st.slider("Year Range", 1997, 2023, (1997, 2023))
         
-        # Filter data
-        plot_df = df[
-            (df['Price'] >= price_filter[0]) & (df['Price'] <= price_filter[1]) &
-            (df['positive_rate'] >= rating_filter[0]) & (df['positive_rate'] <= rating_filter[1]) &
-            (df['Release_Year'] >= year_filter[0]) & (df['Release_Year'] <= year_filter[1])
-        ].sample(min(sample_size, len(df)))
+        # Filter data (genre aggregates use the full filtered set, charts a sample)
+        builder_filters = {'Price': price_filter, 'positive_rate': rating_filter, 'Release_Year': year_filter}
+        filter_rows = filter_engine.query(builder_filters)
+        # Seeded sample of the filtered rows, identical across reruns
+        strata = {"Release year": 'year', "Price bucket": 'price_bucket', "Genre": 'genre'}.get(strata_label)
+        plot_df = df.iloc[sampler.sample(filter_rows, sample_size, strata, builder_filters)]
         
         st.markdown("---")
         
         # Generate chart based on selection
         try:
             if chart_type == "Scatter Plot":
-                fig = px.scatter(
-                    plot_df,
-                    x=x_axis,
-                    y=y_axis,
-                    color=color_by,
-                    size='total_reviews',
-                    hover_data=['Name', 'Main_Developer'],
-                    color_continuous_scale='Viridis',
-                    title=f"{y_axis} vs {x_axis}",
-                    log_x=use_log,
-                    log_y=use_log
+                # Scatters cover every filtered game instead of the sample
+                plan = scatter_planner.plan(
+                    x_axis, y_axis, rows=filter_rows, filters=builder_filters, log_x=use_log, log_y=use_log
+                )
+                fig = scatter_figure(
+                    df, plan, x_axis, y_axis, color_by, 'total_reviews', 'Viridis',
+                    f"{y_axis} vs {x_axis}", log_x=use_log, log_y=use_log
                 )
             
             elif chart_type == "Bubble Chart":
-                fig = px.scatter(
-                    plot_df,
-                    x=x_axis,
-                    y=y_axis,
-                    size=size_by,
-                    color=color_by,
-                    hover_data=['Name', 'Main_Developer'],
-                    color_continuous_scale='Plasma',
-                    title=f"Bubble Chart: {y_axis} vs {x_axis}",
-                    log_x=use_log
+                plan = scatter_planner.plan(x_axis, y_axis, rows=filter_rows, filters=builder_filters, log_x=use_log)
+                fig = scatter_figure(
+                    df, plan, x_axis, y_axis, color_by, size_by, 'Plasma',
+                    f"Bubble Chart: {y_axis} vs {x_axis}", log_x=use_log
                 )
             
             elif chart_type == "Line Chart":
                 if group_by != "None":
                     # Group by category and aggregate
-                    line_data = plot_df.groupby([x_axis, group_by])[y_axis].mean().reset_index()
+                    line_data = plot_df.groupby([x_axis, group_by], observed=True)[y_axis].mean().reset_index()
                     fig = px.line(
                         line_data,
                         x=x_axis,
@@ -622,7 +871,7 @@ elif page == "📈 Interactive Analysis":
                         markers=True
                     )
                 else:
-                    line_data = plot_df.groupby(x_axis)[y_axis].mean().reset_index()
+                    line_data = plot_df.groupby(x_axis, observed=True)[y_axis].mean().reset_index()
                     fig = px.line(
                         line_data,
                         x=x_axis,
@@ -633,7 +882,7 @@ elif page == "📈 Interactive Analysis":
             
             elif chart_type == "Area Chart":
                 if group_by != "None":
-                    area_data = plot_df.groupby([x_axis, group_by])[y_axis].sum().reset_index()
+                    area_data = plot_df.groupby([x_axis, group_by], observed=True)[y_axis].sum().reset_index()
                     fig = px.area(
                         area_data,
                         x=x_axis,
@@ -642,7 +891,7 @@ elif page == "📈 Interactive Analysis":
                         title=f"{y_axis} by {x_axis}"
                     )
                 else:
-                    area_data = plot_df.groupby(x_axis)[y_axis].sum().reset_index()
+                    area_data = plot_df.groupby(x_axis, observed=True)[y_axis].sum().reset_index()
                     fig = px.area(
                         area_data,
                         x=x_axis,
@@ -651,9 +900,22 @@ elif page == "📈 Interactive Analysis":
                     )
             
             elif chart_type == "Bar Chart":
-                if category in categorical_cols:
+                if category == "Genres":
+                    # Per-genre means from the sparse genre matrix over the full filtered set
+                    genre_stats = genre_index.aggregate(df, [value], rows=filter_rows)
+                    bar_data = genre_stats[f'{value}_mean'].nlargest(top_n).reset_index()
+                    bar_data.columns = [category, value]
+                    if orientation == "Horizontal":
+                        fig = px.bar(bar_data, y=category, x=value, orientation='h',
+                                   color=value, color_continuous_scale='Blues',
+                                   title=f"Top {top_n} {category} by {value}")
+                    else:
+                        fig = px.bar(bar_data, x=category, y=value,
+                                   color=value, color_continuous_scale='Blues',
+                                   title=f"Top {top_n} {category} by {value}")
+                elif category in categorical_cols:
                     # Aggregate categorical data
-                    bar_data = plot_df.groupby(category)[value].mean().nlargest(top_n).reset_index()
+                    bar_data = plot_df.groupby(category, observed=True)[value].mean().nlargest(top_n).reset_index()
                     if orientation == "Horizontal":
                         fig = px.bar(bar_data, y=category, x=value, orientation='h',
                                    color=value, color_continuous_scale='Blues',
@@ -673,15 +935,15 @@ elif page == "📈 Interactive Analysis":
             
             elif chart_type == "Pie Chart":
                 if category == "Genres":
-                    # Explode genres
-                    genre_data = plot_df.explode('genre_list')
-                    pie_data = genre_data.groupby('genre_list')[value].sum().nlargest(top_n).reset_index()
+                    # Per-genre sums from the sparse genre matrix over the full filtered set
+                    genre_stats = genre_index.aggregate(df, [value], rows=filter_rows)
+                    pie_data = genre_stats[f'{value}_sum'].nlargest(top_n).reset_index()
                     pie_data.columns = ['Category', 'Value']
                 elif category == "Main_Developer":
-                    pie_data = plot_df.groupby(category)[value].sum().nlargest(top_n).reset_index()
+                    pie_data = plot_df.groupby(category, observed=True)[value].sum().nlargest(top_n).reset_index()
                     pie_data.columns = ['Category', 'Value']
                 else:
-                    pie_data = plot_df.groupby(category)[value].sum().nlargest(top_n).reset_index()
+                    pie_data = plot_df.groupby(category, observed=True)[value].sum().nlargest(top_n).reset_index()
                     pie_data.columns = ['Category', 'Value']
                 
                 fig = px.pie(
@@ -693,63 +955,28 @@ elif page == "📈 Interactive Analysis":
                 )
             
             elif chart_type == "Histogram":
-                fig = px.histogram(
-                    plot_df,
-                    x=metric,
-                    nbins=bins,
-                    title=f"Distribution of {metric}",
-                    color_discrete_sequence=['#1b2838'],
-                    marginal="box" if show_kde else None
-                )
+                # Binned on the server over every filtered game, not the sample
+                hist = binner.histogram(metric, bins, use_log, rows=filter_rows, filters=builder_filters)
+                kde_curve = binner.kde(metric, rows=filter_rows, filters=builder_filters) if show_kde and not use_log else None
+                fig = histogram_figure(hist, f"Distribution of {metric}", '#1b2838', log=use_log, kde_curve=kde_curve)
             
-            elif chart_type == "Box Plot":
-                if group_by != "None":
-                    # Sample groups for better visualization
-                    if group_by == "Main_Developer":
-                        top_devs = plot_df['Main_Developer'].value_counts().head(10).index
-                        plot_df_filtered = plot_df[plot_df['Main_Developer'].isin(top_devs)]
-                    else:
-                        plot_df_filtered = plot_df
-                    
-                    fig = px.box(
-                        plot_df_filtered,
-                        x=group_by,
-                        y=metric,
-                        color=group_by,
-                        title=f"{metric} Distribution by {group_by}"
-                    )
-                else:
-                    fig = px.box(
-                        plot_df,
-                        y=metric,
-                        title=f"{metric} Distribution",
-                        color_discrete_sequence=['#667eea']
-                    )
-            
-            elif chart_type == "Violin Plot":
+            elif chart_type in ["Box Plot", "Violin Plot"]:
+                # Quartiles / KDE computed on the server over every filtered game
+                summarize = distributions.violin if chart_type == "Violin Plot" else distributions.box
+                summaries = summarize(
+                    metric,
+                    group_by=None if group_by == "None" else group_by,
+                    rows=filter_rows,
+                    filters=builder_filters,
+                    max_groups=10 if group_by == "Main_Developer" else 40
+                )
                 if group_by != "None":
-                    if group_by == "Main_Developer":
-                        top_devs = plot_df['Main_Developer'].value_counts().head(10).index
-                        plot_df_filtered = plot_df[plot_df['Main_Developer'].isin(top_devs)]
-                    else:
-                        plot_df_filtered = plot_df
-                    
-                    fig = px.violin(
-                        plot_df_filtered,
-                        x=group_by,
-                        y=metric,
-                        color=group_by,
-                        box=True,
-                        title=f"{metric} Distribution by {group_by}"
-                    )
+                    title = f"{metric} Distribution by {group_by}"
+                    colors = None
                 else:
-                    fig = px.violin(
-                        plot_df,
-                        y=metric,
-                        box=True,
-                        title=f"{metric} Distribution",
-                        color_discrete_sequence=['#764ba2']
-                    )
+                    title = f"{metric} Distribution"
+                    colors = ['#764ba2'] if chart_type == "Violin Plot" else ['#667eea']
+                fig = box_figure(summaries, title, colors, violin=chart_type == "Violin Plot")
             
             elif chart_type == "Heatmap":
                 if len(selected_metrics) >= 2:
@@ -810,28 +1037,28 @@ elif page == "📈 Interactive Analysis":
             help="Pick a numeric variable to analyze"
         )
         
+        log_bins = st.checkbox(
+            "Log-scale bins",
+            value=metric in HEAVY_TAILED,
+            help="Log-spaced bins spread out heavy-tailed metrics such as review counts"
+        )
+        
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown(f"#### Histogram - {metric}")
-            fig1 = px.histogram(
-                df,
-                x=metric,
-                nbins=50,
-                title=f"Distribution of {metric}",
-                color_discrete_sequence=['#1b2838']
+            fig1 = histogram_figure(
+                binner.histogram(metric, bins=50, log=log_bins),
+                f"Distribution of {metric}",
+                '#1b2838',
+                log=log_bins
             )
             fig1.update_layout(height=400)
             st.plotly_chart(fig1, width='stretch')
         
         with col2:
             st.markdown(f"#### Box Plot - {metric}")
-            fig2 = px.box(
-                df,
-                y=metric,
-                title=f"Box Plot of {metric}",
-                color_discrete_sequence=['#667eea']
-            )
+            fig2 = box_figure(distributions.box(metric), f"Box Plot of {metric}", ['#667eea'])
             fig2.update_layout(height=400)
             st.plotly_chart(fig2, width='stretch')
         
@@ -877,16 +1104,11 @@ elif page == "📈 Interactive Analysis":
         fig.update_layout(height=700)
         st.plotly_chart(fig, width='stretch')
     
-    elif analysis_type == "Time Series Analysis":
+    elif analysis_type.startswith("📅"):
         st.markdown("### 📅 Time Series Analysis")
         
-        # Games per year
-        year_data = df.groupby('Release_Year').agg({
-            'Name': 'count',
-            'Price': 'mean',
-            'positive_rate': 'mean',
-            'total_reviews': 'sum'
-        }).reset_index()
+        # Games per year, summed from the aggregate cube
+        year_data = cube.by_year()[['count', 'Price_mean', 'positive_rate_mean', 'total_reviews_sum']].reset_index()
         year_data.columns = ['Year', 'Game_Count', 'Avg_Price', 'Avg_Rating', 'Total_Reviews']
         
         metric = st.selectbox(
@@ -908,7 +1130,7 @@ elif page == "📈 Interactive Analysis":
         # Show data table
         st.dataframe(year_data, width='stretch', hide_index=True)
     
-    elif analysis_type == "Developer Analysis":
+    elif analysis_type.startswith("🏢"):
         st.markdown("### 🏢 Developer Analysis")
         
         analysis_mode = st.radio(
@@ -924,7 +1146,7 @@ elif page == "📈 Interactive Analysis":
             )
             top_n = st.slider("Show Top N Developers", 5, 30, 15)
             
-            dev_stats = df.groupby('Main_Developer').agg({
+            dev_stats = df.groupby('Main_Developer', observed=True).agg({
                 'Name': 'count',
                 'total_reviews': 'sum',
                 'positive_rate': 'mean',
@@ -980,7 +1202,7 @@ elif page == "📈 Interactive Analysis":
         
         elif analysis_mode == "Developer Comparison":
             # Select developers to compare
-            top_devs = df['Main_Developer'].value_counts().head(50).index.tolist()
+            top_devs = rank_index.top_groups('Main_Developer', 50)
             selected_devs = st.multiselect(
                 "Select Developers to Compare (2-5):",
                 top_devs,
@@ -993,7 +1215,7 @@ elif page == "📈 Interactive Analysis":
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    dev_metrics = compare_data.groupby('Main_Developer').agg({
+                    dev_metrics = compare_data.groupby('Main_Developer', observed=True).agg({
                         'Name': 'count',
                         'positive_rate': 'mean',
                         'Price': 'mean',
@@ -1037,10 +1259,11 @@ elif page == "📈 Interactive Analysis":
         else:  # Developer Portfolio
             developer = st.selectbox(
                 "Select Developer",
-                df['Main_Developer'].value_counts().head(50).index.tolist()
+                rank_index.top_groups('Main_Developer', 50)
             )
             
-            dev_games = df[df['Main_Developer'] == developer].copy()
+            dev_rows = rank_index.rows_of('Main_Developer', developer)
+            dev_games = df.iloc[dev_rows].copy()
             
             st.markdown(f"### 📊 {developer} Portfolio Analysis")
             
@@ -1058,7 +1281,7 @@ elif page == "📈 Interactive Analysis":
             
             with col1:
                 fig1 = px.bar(
-                    dev_games.nlargest(10, 'total_reviews'),
+                    df.iloc[rank_index.top_k('total_reviews', 10, dev_rows)],
                     x='total_reviews',
                     y='Name',
                     orientation='h',
@@ -1080,24 +1303,12 @@ elif page == "📈 Interactive Analysis":
                 )
                 st.plotly_chart(fig2, width='stretch')
     
-    elif analysis_type == "Platform Comparison":
+    elif analysis_type.startswith("💻"):
         st.markdown("### 💻 Platform Comparison Analysis")
         
-        # Platform statistics
-        platform_data = pd.DataFrame({
-            'Platform': ['Windows', 'Mac', 'Linux'],
-            'Game_Count': [df['Windows'].sum(), df['Mac'].sum(), df['Linux'].sum()],
-            'Avg_Price': [
-                df[df['Windows']==1]['Price'].mean(),
-                df[df['Mac']==1]['Price'].mean(),
-                df[df['Linux']==1]['Price'].mean()
-            ],
-            'Avg_Rating': [
-                df[df['Windows']==1]['positive_rate'].mean(),
-                df[df['Mac']==1]['positive_rate'].mean(),
-                df[df['Linux']==1]['positive_rate'].mean()
-            ]
-        })
+        # Platform statistics, summed from the aggregate cube
+        platform_data = cube.by_platform()[['count', 'Price_mean', 'positive_rate_mean']].reset_index()
+        platform_data.columns = ['Platform', 'Game_Count', 'Avg_Price', 'Avg_Rating']
         
         col1, col2, col3 = st.columns(3)
         
@@ -1140,20 +1351,10 @@ elif page == "📈 Interactive Analysis":
         # Multi-platform analysis
         st.markdown("### 🔄 Multi-Platform Analysis")
         
-        df['platform_category'] = df.apply(
-            lambda row: 'All Platforms' if row['platform_count'] == 3
-            else 'Windows Only' if row['Windows'] and row['platform_count'] == 1
-            else 'Mac Only' if row['Mac'] and row['platform_count'] == 1
-            else 'Linux Only' if row['Linux'] and row['platform_count'] == 1
-            else 'Multi-Platform (2)', axis=1
-        )
-        
-        multi_stats = df.groupby('platform_category').agg({
-            'Name': 'count',
-            'positive_rate': 'mean',
-            'total_reviews': 'mean',
-            'Price': 'mean'
-        }).reset_index()
+        # Platform categories are groups of platform-mask cells of the cube
+        multi_stats = cube.by_platform_category()[
+            ['count', 'positive_rate_mean', 'total_reviews_mean', 'Price_mean']
+        ].reset_index()
         multi_stats.columns = ['Category', 'Game_Count', 'Avg_Rating', 'Avg_Reviews', 'Avg_Price']
         
         col1, col2 = st.columns(2)
@@ -1184,18 +1385,13 @@ elif page == "📈 Interactive Analysis":
             st.plotly_chart(fig5, width='stretch')
         
         st.dataframe(multi_stats, width='stretch', hide_index=True)
+    
+    elif analysis_type.startswith("🎮"):
         st.markdown("### 🎮 Genre Analysis")
         
-        # Explode genres
-        genre_exploded = df.explode('genre_list')
-        genre_exploded['genre_list'] = genre_exploded['genre_list'].str.strip()
-        
-        genre_stats = genre_exploded.groupby('genre_list').agg({
-            'Name': 'count',
-            'Price': 'mean',
-            'positive_rate': 'mean',
-            'total_reviews': 'sum'
-        }).reset_index()
+        # Per-genre aggregates summed from the aggregate cube
+        genre_stats = cube.summary('genre')
+        genre_stats = genre_stats[['count', 'Price_mean', 'positive_rate_mean', 'total_reviews_sum']].reset_index()
         genre_stats.columns = ['Genre', 'Game_Count', 'Avg_Price', 'Avg_Rating', 'Total_Reviews']
         genre_stats = genre_stats.sort_values('Game_Count', ascending=False).head(20)
         
@@ -1310,6 +1506,9 @@ elif page == "🖼️ Static Panels":
                         st.warning(f"⚠️ {title} not found")
 
 elif page == "📋 Data Table":
+    text_indexes = load_text_indexes(source_hash)
+    rank_index, _ = load_rank_index(source_hash)
+    
     st.markdown('<div class="main-header">📋 Data Table</div>', unsafe_allow_html=True)
     
     st.info("""💡 **How to use**
@@ -1329,16 +1528,30 @@ elif page == "📋 Data Table":
     with col3:
         ascending = st.checkbox("Ascending", value=True)
     
-    # Filter data
-    display_df = df.copy()
+    with st.expander("🔧 Filters"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            price_filter = st.slider("Price Range", 0, 100, (0, 100))
+        with col2:
+            rating_filter = st.slider("Rating Range", 0, 100, (0, 100))
+        with col3:
+            year_filter = st.slider("Year Range", 1997, 2023, (1997, 2023))
+    
+    # Filter data (sliders left at their full extent don't filter, so games
+    # over $100 and games without a release year stay listed)
+    slider_filters = [
+        ('Price', price_filter, (0, 100)),
+        ('positive_rate', rating_filter, (0, 100)),
+        ('Release_Year', year_filter, (1997, 2023))
+    ]
+    rows = filter_engine.query({col: value for col, value, full in slider_filters if value != full})
     
     if search:
-        mask = display_df['Name'].str.contains(search, case=False, na=False) | \
-               display_df['Developers'].str.contains(search, case=False, na=False)
-        display_df = display_df[mask]
+        matches = np.union1d(text_indexes['Name'].search(search), text_indexes['Developers'].search(search))
+        rows = np.intersect1d(rows, matches, assume_unique=True)
     
-    # Sort
-    display_df = display_df.sort_values(sort_by, ascending=ascending)
+    # Sort by walking the presorted order
+    display_df = df.iloc[rank_index.sort(rows, sort_by, ascending)]
     
     # Select columns to display
     st.markdown("### 📊 Select Columns to Display")
@@ -1381,6 +1594,12 @@ elif page == "📋 Data Table":
             )
 
 elif page == "💡 Insights":
+    rank_index, _ = load_rank_index(source_hash)
+    fuzzy_search = load_fuzzy_search(source_hash)
+    game_lookup = load_game_lookup(source_hash)
+    similarity_index = load_similarity_index(source_hash)
+    content_index = load_content_index(source_hash)
+    
     st.markdown('<div class="main-header">💡 Data Insights & Recommendations</div>', unsafe_allow_html=True)
     
     st.info("""💡 **What's inside?** 
@@ -1412,7 +1631,8 @@ elif page == "💡 Insights":
             
             st.write(f"- **{high_rated:,}** games with 80%+ rating ({high_rated/len(df)*100:.1f}%)")
             st.write(f"- Average rating: **{avg_rating:.1f}%**")
-            st.write(f"- Highest rated: **{df.nlargest(1, 'positive_rate')['Name'].values[0]}** ({df['positive_rate'].max():.1f}%)")
+            best = rank_index.top_k('wilson_score', 1)[0]
+            st.write(f"- Highest rated (confidence-adjusted): **{df['Name'].iloc[best]}** ({df['positive_rate'].iloc[best]:.1f}% of {df['total_reviews'].iloc[best]:,} reviews)")
         
         with col2:
             st.markdown("#### 🎮 Platform Insights")
@@ -1435,14 +1655,10 @@ elif page == "💡 Insights":
     with tab2:
         st.markdown("### 🎯 Success Pattern Analysis")
         
-        # Define success (top 10% by combined score)
-        df['success_score'] = (df['positive_rate'] * 0.4 + 
-                               np.log1p(df['total_reviews']) / np.log1p(df['total_reviews'].max()) * 100 * 0.6)
-        success_threshold = df['success_score'].quantile(0.9)
-        df['is_success'] = df['success_score'] >= success_threshold
-        
-        successful = df[df['is_success']]
-        others = df[~df['is_success']]
+        # Define success (top 10% by combined score, cached outside the shared frame)
+        _, is_success = load_success_scores(source_hash)
+        successful = df[is_success]
+        others = df[~is_success]
         
         st.write(f"Comparing top 10% successful games (**{len(successful)}** games) vs others")
         
@@ -1509,31 +1725,55 @@ elif page == "💡 Insights":
     with tab3:
         st.markdown("### 🔮 Find Similar Games")
         
-        # Game selector
+        similarity_mode = st.radio(
+            "Similarity type",
+            ["📊 Features (price, rating, playtime...)", "🏷️ Content (tags & description)"],
+            horizontal=True
+        )
+        
+        # Game selector (any game in the catalog via search)
+        reference_search = st.text_input(
+            "🔎 Search the full catalog (optional)",
+            placeholder="Leave empty to pick from the 500 most-reviewed games"
+        )
+        if reference_search:
+            reference_options = df['AppID'].iloc[fuzzy_search.search(reference_search, k=50)['row']].tolist()
+        else:
+            reference_options = df['AppID'].iloc[rank_index.top_k('total_reviews', 500)].tolist()
         reference_game = st.selectbox(
             "Select a game to find similar ones:",
-            df.nlargest(500, 'total_reviews')['Name'].tolist()
+            reference_options,
+            format_func=game_lookup.label
         )
         
+        if similarity_mode.startswith("📊"):
+            with st.expander("⚙️ Similarity weights", expanded=False):
+                st.caption("How much each feature counts when comparing games")
+                weight_cols = st.columns(len(DEFAULT_WEIGHTS) + 1)
+                weights = {}
+                for col, (feature, default) in zip(weight_cols, DEFAULT_WEIGHTS.items()):
+                    with col:
+                        weights[feature] = st.slider(feature, 0.0, 1.0, default, 0.05)
+                with weight_cols[-1]:
+                    genre_weight = st.slider("Genres", 0.0, 1.0, 0.0, 0.05)
+        
         if reference_game:
-            ref_game_data = df[df['Name'] == reference_game].iloc[0]
-            
-            # Calculate similarity based on multiple factors
-            df['similarity'] = (
-                1 - abs(df['Price'] - ref_game_data['Price']) / (df['Price'].max() + 1) * 0.2 +
-                1 - abs(df['positive_rate'] - ref_game_data['positive_rate']) / 100 * 0.3 +
-                1 - abs(df['Median playtime forever'] - ref_game_data['Median playtime forever']) / (df['Median playtime forever'].max() + 1) * 0.2 +
-                1 - abs(df['Release_Year'] - ref_game_data['Release_Year']) / 30 * 0.1 +
-                (df['platform_count'] == ref_game_data['platform_count']).astype(int) * 0.2
-            )
+            reference_row = game_lookup.row(reference_game)
+            same_name = game_lookup.same_name_rows(reference_game)
             
-            # Find top 10 similar games (excluding the reference game)
-            similar_games = df[df['Name'] != reference_game].nlargest(10, 'similarity')
+            # Top 10 nearest neighbours (excluding the reference game and its namesakes)
+            if similarity_mode.startswith("📊"):
+                neighbors = similarity_index.neighbors(
+                    reference_row, k=10, weights=weights, genre_weight=genre_weight, exclude=same_name
+                )
+            else:
+                neighbors = content_index.neighbors(reference_row, k=10, exclude=same_name)
+            similar_games = df.iloc[neighbors['row']].assign(similarity=neighbors['similarity'].to_numpy())
             
-            st.markdown(f"#### Games Similar to **{reference_game}**")
+            st.markdown(f"#### Games Similar to **{game_lookup.label(reference_game)}**")
             
             st.dataframe(
-                similar_games[['Name', 'Main_Developer', 'Price', 'positive_rate', 'total_reviews', 'Median playtime forever']]
+                similar_games[['Name', 'Main_Developer', 'Price', 'positive_rate', 'total_reviews', 'Median playtime forever', 'similarity']]
                 .style.background_gradient(subset=['positive_rate'], cmap='RdYlGn'),
                 width='stretch',
                 hide_index=True
@@ -0,0 +1,27 @@
+"""
+STEAM DATA
+Dataset loading and caching helpers shared by the dashboard and scripts
+"""
+
+from .dataset import RAW_CSV, prepare_dataset, read_raw_dataset
+from .snapshot import load_snapshot, snapshot_path, source_digest
+from .features import FEATURES_PATH, build_feature_table, load_features
+from .genre_codes import GenreCodes
+from .genre_index import GenreIndex
+from .text_index import TrigramIndex
+from .fuzzy_search import FuzzySearch, normalize_name
+from .game_lookup import GameLookup
+from .autocomplete import NameAutocomplete
+from .similarity import DEFAULT_WEIGHTS, SimilarityIndex
+from .content_similarity import ContentIndex, build_tfidf
+from .filter_engine import FILTER_COLUMNS, FilterEngine
+from .result_cache import ResultCache, filter_key
+from .cube import AggregateCube
+from .range_aggregates import RangeAggregates
+from .binning import HEAVY_TAILED, Binner, histogram, kde
+from .box_stats import DistributionSummaries, box_stats
+from .scatter import ScatterPlanner, density_plan
+from .sampling import STRATA, Sampler
+from .rank_index import RankIndex
+from .schema import apply_schema, memory_report
+from .derived import bayesian_average, rating_scores, success_mask, success_scores, wilson_lower_bound
@@ -0,0 +1,89 @@
+"""
+NAME AUTOCOMPLETE
+Top-k completions of a typed prefix, most-reviewed first. Case-folded names
+are kept in one sorted list, so the games starting with a prefix are a
+contiguous range found by two binary searches. A sparse table answers
+"most-reviewed game in a range" in O(1), and a small heap splits the range
+around each pick, so k completions cost O(log n + k log k) however many
+games share the prefix
+"""
+
+import heapq
+from bisect import bisect_left
+
+import numpy as np
+
+# Sorts after every character a name can continue with
+_MAX_CHAR = '\U0010ffff'
+
+
+def fold(text):
+    """Case-folded, whitespace-trimmed text ('' for missing names)"""
+    return text.strip().casefold() if isinstance(text, str) else ''
+
+
+class NameAutocomplete:
+    """Prefix completions over game names, weighted by review count"""
+
+    def __init__(self, names, weights):
+        keys = [fold(name) for name in names]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in order]
+        self.rows = np.asarray(order, dtype=np.int64)
+
+        # Popularity rank of each sorted position (0 = most reviewed)
+        weights = np.nan_to_num(np.asarray(weights, dtype=float))[self.rows]
+        self.rank = np.empty(len(self.rows), dtype=np.int64)
+        self.rank[np.argsort(-weights, kind='stable')] = np.arange(len(self.rows))
+
+        # Sparse table: levels[j][i] = best position in [i, i + 2**j)
+        self.levels = [np.arange(len(self.rows), dtype=np.int32)]
+        span = 1
+        while 2 * span <= len(self.rows):
+            prev = self.levels[-1]
+            left, right = prev[:-span], prev[span:]
+            self.levels.append(np.where(self.rank[left] <= self.rank[right], left, right))
+            span *= 2
+
+    @classmethod
+    def from_frame(cls, df):
+        """Completions over df['Name'], weighted by total_reviews"""
+        return cls(df['Name'].tolist(), df['total_reviews'].to_numpy(dtype=float))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def prefix_range(self, prefix):
+        """[lo, hi) of the sorted positions whose name starts with prefix"""
+        prefix = fold(prefix)
+        return bisect_left(self.keys, prefix), bisect_left(self.keys, prefix + _MAX_CHAR)
+
+    def count(self, prefix):
+        """Number of games whose name starts with prefix"""
+        lo, hi = self.prefix_range(prefix)
+        return hi - lo
+
+    def _best(self, lo, hi):
+        """Most-reviewed sorted position in [lo, hi)"""
+        level = (hi - lo).bit_length() - 1
+        a, b = self.levels[level][lo], self.levels[level][hi - (1 << level)]
+        return int(a if self.rank[a] <= self.rank[b] else b)
+
+    def complete(self, prefix, k=10):
+        """Row positions of the k most-reviewed games whose name starts with prefix"""
+        lo, hi = self.prefix_range(prefix)
+        heap = []
+        if lo < hi:
+            best = self._best(lo, hi)
+            heap.append((self.rank[best], best, lo, hi))
+
+        picked = []
+        while heap and len(picked) < k:
+            _, pos, lo, hi = heapq.heappop(heap)
+            picked.append(pos)
+            # The rest of the range is the parts left and right of the pick
+            for a, b in ((lo, pos), (pos + 1, hi)):
+                if a < b:
+                    best = self._best(a, b)
+                    heapq.heappush(heap, (self.rank[best], best, a, b))
+        return self.rows[np.array(picked, dtype=np.int64)]
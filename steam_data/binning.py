@@ -0,0 +1,92 @@
+"""
+SERVER-SIDE BINNING
+Histogram counts and KDE curves computed with NumPy on the server, so charts
+ship bin edges and counts to the browser instead of every row. Heavy-tailed
+metrics can use log-spaced bins. Results are memoized per metric, bin count,
+scale and filter state
+"""
+
+import numpy as np
+
+from .result_cache import ResultCache, filter_key
+
+# Metrics whose distribution is best viewed with log-spaced bins
+HEAVY_TAILED = ['total_reviews', 'Positive', 'Negative', 'Median playtime forever', 'Average playtime forever']
+
+
+def bin_edges(values, bins=50, log=False):
+    """Linear or log1p-spaced bin edges spanning the finite values"""
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return np.array([0.0, 1.0])
+    low, high = values.min(), values.max()
+    if log and low >= 0:
+        return np.expm1(np.linspace(np.log1p(low), np.log1p(high), bins + 1))
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1)
+
+
+def histogram(values, bins=50, log=False):
+    """Histogram as a dict of edges and counts (NaNs ignored)"""
+    values = np.asarray(values, dtype=float)
+    edges = bin_edges(values, bins, log)
+    counts, _ = np.histogram(values[np.isfinite(values)], bins=edges)
+    return {'edges': edges, 'counts': counts}
+
+
+def kde(values, points=200, grid_bins=1024):
+    """Gaussian KDE on an even grid, as (grid, density)
+
+    The values are pre-binned on a fine grid and the kernel is applied by
+    convolution, so the cost does not grow with the number of rows.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    if len(values) < 2 or values.min() == values.max():
+        return np.array([]), np.array([])
+
+    # Silverman's rule of thumb bandwidth
+    iqr = np.subtract(*np.percentile(values, [75, 25]))
+    spread = min(values.std(ddof=1), iqr / 1.34) if iqr > 0 else values.std(ddof=1)
+    bandwidth = 0.9 * spread * len(values) ** -0.2
+
+    low, high = values.min() - 3 * bandwidth, values.max() + 3 * bandwidth
+    counts, edges = np.histogram(values, bins=grid_bins, range=(low, high))
+    step = edges[1] - edges[0]
+
+    half_width = int(np.ceil(4 * bandwidth / step))
+    offsets = np.arange(-half_width, half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= kernel.sum()
+    density = np.convolve(counts, kernel, mode='same')[:grid_bins] / (len(values) * step)
+
+    centers = (edges[:-1] + edges[1:]) / 2
+    grid = np.linspace(low, high, points)
+    return grid, np.interp(grid, centers, density)
+
+
+class Binner:
+    """Cached histograms and KDE curves over the columns of one frame"""
+
+    def __init__(self, df, cache=None):
+        self.df = df
+        self.cache = cache if cache is not None else ResultCache()
+
+    def _values(self, metric, rows):
+        values = self.df[metric].to_numpy(dtype=float)
+        return values if rows is None else values[rows]
+
+    def histogram(self, metric, bins=50, log=False, rows=None, filters=None):
+        """Histogram of metric over rows; filters identifies rows in the cache key"""
+        key = {'kind': 'histogram', 'metric': metric, 'bins': bins, 'log': log, 'filters': filter_key(filters or {})}
+        return self.cache.get_or_compute(key, lambda: histogram(self._values(metric, rows), bins, log))
+
+    def kde(self, metric, rows=None, filters=None, points=200):
+        """KDE curve of metric over rows as a dict of grid and density"""
+        key = {'kind': 'kde', 'metric': metric, 'points': points, 'filters': filter_key(filters or {})}
+
+        def compute():
+            grid, density = kde(self._values(metric, rows), points)
+            return {'grid': grid, 'density': density}
+        return self.cache.get_or_compute(key, compute)
@@ -0,0 +1,115 @@
+"""
+BOX AND VIOLIN SUMMARIES
+Per-group quartiles, Tukey whiskers, a bounded outlier sample and a KDE
+curve, computed on the server so box and violin charts receive a handful
+of numbers per group instead of every row. Summaries are memoized per
+metric, grouping and filter state
+"""
+
+import numpy as np
+import pandas as pd
+
+from .binning import kde
+from .result_cache import ResultCache, filter_key
+
+# Outlier points kept per group (the most extreme ones plus an even spread)
+MAX_OUTLIERS = 100
+
+# Groups shown for categorical groupings (most frequent first)
+MAX_GROUPS = 40
+
+
+def box_stats(values, max_outliers=MAX_OUTLIERS):
+    """Quartiles, Tukey whiskers, mean and a bounded outlier sample of values"""
+    values = np.sort(np.asarray(values, dtype=float))
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return None
+
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outliers = values[(values < inside[0]) | (values > inside[-1])]
+
+    if len(outliers) > max_outliers:
+        # Keep both extremes and an evenly spaced selection in between
+        keep = np.unique(np.linspace(0, len(outliers) - 1, max_outliers).round().astype(int))
+        outliers = outliers[keep]
+
+    return {
+        'n': len(values),
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'lowerfence': inside[0],
+        'upperfence': inside[-1],
+        'mean': values.mean(),
+        'outliers': outliers
+    }
+
+
+def group_positions(groups, max_groups=MAX_GROUPS, sort_groups=False):
+    """{group: row positions} for the most frequent groups (NaN groups dropped)"""
+    codes, uniques = pd.factorize(pd.Series(groups), sort=False)
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=len(uniques))
+    top = np.argsort(-counts, kind='stable')[:max_groups]
+    top = top[counts[top] > 0]
+    if sort_groups:
+        top = top[np.argsort(np.asarray(uniques)[top], kind='stable')]
+
+    order = np.argsort(codes, kind='stable')
+    starts = np.searchsorted(codes[order], top, side='left')
+    stops = np.searchsorted(codes[order], top, side='right')
+    return {uniques[g]: order[start:stop] for g, start, stop in zip(top, starts, stops)}
+
+
+class DistributionSummaries:
+    """Cached box / violin statistics over the columns of one frame"""
+
+    def __init__(self, df, cache=None):
+        self.df = df
+        self.cache = cache if cache is not None else ResultCache()
+
+    def _groups(self, metric, group_by, rows, max_groups):
+        values = self.df[metric].to_numpy(dtype=float)
+        if rows is not None:
+            values = values[rows]
+        if group_by is None:
+            return {metric: values}
+
+        groups = self.df[group_by]
+        if rows is not None:
+            groups = groups.iloc[rows]
+        sort_groups = pd.api.types.is_numeric_dtype(groups)
+        positions = group_positions(groups.to_numpy(), max_groups, sort_groups)
+        return {
+            (int(g) if sort_groups and float(g).is_integer() else g): values[p]
+            for g, p in positions.items()
+        }
+
+    def box(self, metric, group_by=None, rows=None, filters=None, max_groups=MAX_GROUPS):
+        """{group: box_stats} for metric, grouped by a column or as a single group"""
+        key = {'kind': 'box', 'metric': metric, 'group_by': group_by, 'max_groups': max_groups,
+               'filters': filter_key(filters or {})}
+
+        def compute():
+            stats = {g: box_stats(v) for g, v in self._groups(metric, group_by, rows, max_groups).items()}
+            return {g: s for g, s in stats.items() if s is not None}
+        return self.cache.get_or_compute(key, compute)
+
+    def violin(self, metric, group_by=None, rows=None, filters=None, max_groups=MAX_GROUPS, points=100):
+        """{group: box_stats plus KDE grid and density} for violin charts"""
+        key = {'kind': 'violin', 'metric': metric, 'group_by': group_by, 'max_groups': max_groups,
+               'points': points, 'filters': filter_key(filters or {})}
+
+        def compute():
+            result = {}
+            for g, values in self._groups(metric, group_by, rows, max_groups).items():
+                stats = box_stats(values)
+                if stats is None:
+                    continue
+                stats['grid'], stats['density'] = kde(values, points)
+                result[g] = stats
+            return result
+        return self.cache.get_or_compute(key, compute)
@@ -0,0 +1,162 @@
+"""
+CONTENT SIMILARITY ENGINE
+Sparse TF-IDF matrix over each game's Tags, Categories and "About the game"
+text, persisted next to the dataset snapshot. "Games like X" is a sparse
+cosine top-k computed block by block over the catalog, so memory stays
+bounded by the block size rather than the catalog size
+"""
+
+import os
+import re
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .snapshot import SNAPSHOT_DIR, SNAPSHOT_VERSION
+
+# Bump whenever FIELD_WEIGHTS, the tokenizer or the weighting changes
+TFIDF_VERSION = 1
+
+# Field -> weight of its terms relative to the others
+FIELD_WEIGHTS = {
+    'Tags': 1.0,
+    'Categories': 0.5,
+    'About the game': 0.7,
+}
+
+# Description words that carry no meaning for similarity
+STOPWORDS = set("""
+    the and for you your with that this are from will have can all its into our
+    their they them has was were been more than what when where who how which
+    game games play player players new one not but also out get just about
+""".split())
+
+# Description terms in more than this share of games are dropped
+MAX_DOC_FREQ = 0.5
+
+_WORD = re.compile(r'[a-z][a-z0-9]{2,}')
+
+
+def _field_terms(field, text):
+    """Terms of one field; tags/categories are whole labels, descriptions are words"""
+    if not isinstance(text, str) or not text:
+        return []
+    if field == 'About the game':
+        return [word for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+    return [f"{field}:{label.strip().lower()}" for label in text.split(',') if label.strip()]
+
+
+def build_tfidf(df, field_weights=FIELD_WEIGHTS):
+    """Row-normalized TF-IDF CSR matrix (games x terms)"""
+    vocab = {}
+    rows, cols, counts, weights = [], [], [], []
+    for field, field_weight in field_weights.items():
+        for row, text in enumerate(df[field].tolist()):
+            terms = Counter(_field_terms(field, text))
+            for term, count in terms.items():
+                rows.append(row)
+                cols.append(vocab.setdefault(term, len(vocab)))
+                counts.append(count)
+                weights.append(field_weight)
+
+    n_docs = len(df)
+    tf = sparse.csr_matrix(
+        ((1 + np.log(counts)) * np.asarray(weights), (rows, cols)),
+        shape=(n_docs, len(vocab)), dtype=np.float32
+    )
+
+    # Smoothed IDF; drop terms that appear almost everywhere
+    doc_freq = np.bincount(cols, minlength=len(vocab))
+    idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+    idf[doc_freq > MAX_DOC_FREQ * n_docs] = 0
+    tfidf = (tf @ sparse.diags(idf.astype(np.float32))).tocsr()
+    tfidf.eliminate_zeros()
+
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return (sparse.diags(1 / norms) @ tfidf).tocsr().astype(np.float32)
+
+
+class ContentIndex:
+    """Cosine top-k over a row-normalized TF-IDF matrix"""
+
+    def __init__(self, matrix, block_size=20000):
+        self.matrix = matrix
+        self.block_size = block_size
+
+    @classmethod
+    def load_or_build(cls, df, path):
+        """Load the persisted matrix at path, or build and save it"""
+        path = Path(path)
+        if path.exists():
+            try:
+                return cls(sparse.load_npz(path))
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                pass  # corrupt or truncated, rebuild below
+
+        matrix = build_tfidf(df)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            sparse.save_npz(f, matrix)
+        # Atomic so concurrent workers never see a half-written matrix
+        os.replace(tmp_path, path)
+
+        # Matrices built from older versions of the dataset are no longer needed
+        for stale in path.parent.glob('content_tfidf.*.npz'):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        return cls(matrix)
+
+    @staticmethod
+    def cache_path(source_hash, snapshot_dir=SNAPSHOT_DIR):
+        """Where the matrix for a given source CSV hash is persisted"""
+        return Path(snapshot_dir) / f"content_tfidf.{source_hash[:16]}.v{SNAPSHOT_VERSION}.t{TFIDF_VERSION}.npz"
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def top_k(self, rows, k=10, exclude=None):
+        """Top-k cosine neighbours of each query row, as (indices, scores) arrays
+
+        The catalog is scanned in blocks of block_size games, keeping a running
+        top-k per query, so at most block_size x len(rows) scores are live.
+        """
+        rows = np.atleast_1d(rows)
+        queries = self.matrix[rows].T.tocsc()
+        best_idx = np.full((len(rows), k), -1, dtype=np.int64)
+        best_score = np.full((len(rows), k), -np.inf, dtype=np.float32)
+
+        for start in range(0, len(self), self.block_size):
+            stop = min(start + self.block_size, len(self))
+            scores = (self.matrix[start:stop] @ queries).toarray().T  # (queries, block)
+            # A game is never its own neighbour
+            for q, row in enumerate(rows):
+                if start <= row < stop:
+                    scores[q, row - start] = -np.inf
+            if exclude is not None:
+                excluded = np.asarray(exclude)
+                excluded = excluded[(excluded >= start) & (excluded < stop)] - start
+                scores[:, excluded] = -np.inf
+
+            # Merge this block's candidates into the running top-k
+            merged_score = np.concatenate([best_score, scores], axis=1)
+            merged_idx = np.concatenate(
+                [best_idx, np.broadcast_to(np.arange(start, stop), scores.shape)], axis=1
+            )
+            keep = np.argpartition(-merged_score, k - 1, axis=1)[:, :k]
+            best_score = np.take_along_axis(merged_score, keep, axis=1)
+            best_idx = np.take_along_axis(merged_idx, keep, axis=1)
+
+        order = np.argsort(-best_score, axis=1, kind='stable')
+        return np.take_along_axis(best_idx, order, axis=1), np.take_along_axis(best_score, order, axis=1)
+
+    def neighbors(self, row, k=10, exclude=None):
+        """Top-k content neighbours of one game as a DataFrame of row and similarity"""
+        idx, score = self.top_k([row], k, exclude)
+        valid = (idx[0] >= 0) & np.isfinite(score[0])
+        return pd.DataFrame({'row': idx[0][valid], 'similarity': score[0][valid]})
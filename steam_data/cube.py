@@ -0,0 +1,212 @@
+"""
+AGGREGATE CUBE
+Count, sum and sum of squares of the summary metrics per cell of
+genre x release year x platform mask x price bucket, built once per dataset
+version and saved as a small .npz next to the snapshot. Per-year, per-genre
+and per-platform summaries are sums over cube cells, not scans over rows.
+Genre slot 0 holds every game once, so non-genre views never double count
+multi-genre games
+"""
+
+import os
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .snapshot import SNAPSHOT_DIR, SNAPSHOT_VERSION
+
+# Bump whenever the cube layout (metrics, price edges, axes) changes
+CUBE_VERSION = 1
+
+# Metrics with count / sum / sum-of-squares per cell
+CUBE_METRICS = ['Price', 'positive_rate', 'total_reviews', 'Median playtime forever']
+
+PLATFORMS = ['Windows', 'Mac', 'Linux']
+
+# Price bucket lower edges; the last bucket is open-ended
+PRICE_EDGES = [0, 0.01, 5, 10, 20, 30, 60]
+PRICE_LABELS = ['Free', '$0-5', '$5-10', '$10-20', '$20-30', '$30-60', '$60+']
+
+ALL_GENRES = '(all)'
+UNKNOWN = -1  # year label for games without a release year
+
+
+def platform_category(platform_mask):
+    """Windows Only / Mac Only / Linux Only / All Platforms / Multi-Platform (2)"""
+    flags = [bool(platform_mask & (1 << i)) for i in range(len(PLATFORMS))]
+    count = sum(flags)
+    if count == 3:
+        return 'All Platforms'
+    if count == 1:
+        return f"{PLATFORMS[flags.index(True)]} Only"
+    return 'Multi-Platform (2)'
+
+
+class AggregateCube:
+    """Dense summary cube over (genre, year, platform mask, price bucket)"""
+
+    def __init__(self, genres, years, count, n, sums, sumsq):
+        self.genres = list(genres)  # genres[0] is ALL_GENRES
+        self.years = np.asarray(years)  # last entry is UNKNOWN
+        self.count = count  # (genre, year, platform, price)
+        self.n = n  # (metric, genre, year, platform, price) non-null counts
+        self.sums = sums
+        self.sumsq = sumsq
+
+    @classmethod
+    def build(cls, df, genre_index):
+        """Aggregate every row of df (rows must match genre_index)"""
+        n_rows = len(df)
+        years = np.sort(df['Release_Year'].dropna().unique().astype(int))
+        year_values = df['Release_Year'].to_numpy(dtype=float)
+        year_code = np.full(n_rows, len(years))
+        known = ~np.isnan(year_values)
+        year_code[known] = np.searchsorted(years, year_values[known].astype(int))
+
+        platform_code = np.zeros(n_rows, dtype=np.int64)
+        for bit, col in enumerate(PLATFORMS):
+            platform_code |= df[col].fillna(False).to_numpy(dtype=bool).astype(np.int64) << bit
+
+        price = df['Price'].to_numpy(dtype=float)
+        price_code = np.searchsorted(PRICE_EDGES, np.nan_to_num(price, nan=0.0).clip(0), side='right') - 1
+
+        # (genre slot, row) pairs: slot 0 = every game, slot g + 1 = genre g
+        incidence = genre_index.incidence.tocoo()
+        slots = np.concatenate([np.zeros(n_rows, dtype=np.int64), incidence.row.astype(np.int64) + 1])
+        rows = np.concatenate([np.arange(n_rows), incidence.col.astype(np.int64)])
+
+        shape = (len(genre_index.genres) + 1, len(years) + 1, 1 << len(PLATFORMS), len(PRICE_EDGES))
+        cells = np.ravel_multi_index(
+            (slots, year_code[rows], platform_code[rows], price_code[rows]), shape
+        )
+        size = int(np.prod(shape))
+
+        count = np.bincount(cells, minlength=size).reshape(shape)
+        n = np.empty((len(CUBE_METRICS),) + shape)
+        sums = np.empty_like(n)
+        sumsq = np.empty_like(n)
+        for m, col in enumerate(CUBE_METRICS):
+            values = df[col].to_numpy(dtype=float)[rows]
+            valid = ~np.isnan(values)
+            values = np.where(valid, values, 0.0)
+            n[m] = np.bincount(cells, weights=valid, minlength=size).reshape(shape)
+            sums[m] = np.bincount(cells, weights=values, minlength=size).reshape(shape)
+            sumsq[m] = np.bincount(cells, weights=values * values, minlength=size).reshape(shape)
+
+        return cls([ALL_GENRES] + list(genre_index.genres), list(years) + [UNKNOWN], count, n, sums, sumsq)
+
+    @classmethod
+    def load_or_build(cls, df, genre_index, path):
+        """Load the cube saved at path, or build and save it"""
+        path = Path(path)
+        if path.exists():
+            try:
+                with np.load(path) as data:
+                    return cls(data['genres'], data['years'], data['count'], data['n'], data['sums'], data['sumsq'])
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                pass  # corrupt or truncated, rebuild below
+
+        cube = cls.build(df, genre_index)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(
+                f, genres=np.array(cube.genres), years=cube.years,
+                count=cube.count, n=cube.n, sums=cube.sums, sumsq=cube.sumsq
+            )
+        # Atomic so concurrent workers never see a half-written cube
+        os.replace(tmp_path, path)
+
+        # Cubes built from older versions of the dataset are no longer needed
+        for stale in path.parent.glob('cube.*.npz'):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        return cube
+
+    @staticmethod
+    def cache_path(source_hash, snapshot_dir=SNAPSHOT_DIR):
+        """Where the cube for a given source CSV hash is persisted"""
+        return Path(snapshot_dir) / f"cube.{source_hash[:16]}.v{SNAPSHOT_VERSION}.c{CUBE_VERSION}.npz"
+
+    def _stats(self, count, n, sums, sumsq, index):
+        """count plus <metric>_sum / _mean / _std columns from reduced cells"""
+        stats = pd.DataFrame({'count': count}, index=index)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for m, col in enumerate(CUBE_METRICS):
+                stats[f'{col}_sum'] = sums[m]
+                stats[f'{col}_mean'] = sums[m] / n[m]
+                variance = (sumsq[m] - sums[m] ** 2 / n[m]) / (n[m] - 1)
+                stats[f'{col}_std'] = np.sqrt(np.clip(variance, 0, None))
+        return stats
+
+    def _reduce(self, by=None, genre=None):
+        """Cell arrays summed down to the `by` axis (count, n, sums, sumsq)"""
+        axes = {'genre': 0, 'year': 1, 'platform_mask': 2, 'price_bucket': 3}
+        if by == 'genre':
+            selected = slice(1, None)
+        else:
+            slot = 0 if genre is None else self.genres.index(genre)
+            selected = slice(slot, slot + 1)
+
+        keep = axes[by] if by is not None else None
+        reduce_axes = tuple(a for a in range(4) if a != keep)
+        metric_axes = tuple(a + 1 for a in reduce_axes)
+        return (
+            np.atleast_1d(self.count[selected].sum(axis=reduce_axes)),
+            self.n[:, selected].sum(axis=metric_axes).reshape(len(CUBE_METRICS), -1),
+            self.sums[:, selected].sum(axis=metric_axes).reshape(len(CUBE_METRICS), -1),
+            self.sumsq[:, selected].sum(axis=metric_axes).reshape(len(CUBE_METRICS), -1)
+        )
+
+    def summary(self, by=None, genre=None):
+        """Cube statistics grouped by 'year', 'genre', 'platform_mask',
+        'price_bucket' or None (a one-row total)
+
+        genre restricts the non-genre views to games of one genre.
+        """
+        if by is None:
+            index = pd.Index(['total'])
+        elif by == 'genre':
+            index = pd.Index(self.genres[1:], name='genre')
+        elif by == 'year':
+            index = pd.Index(self.years, name='year')
+        elif by == 'platform_mask':
+            index = pd.RangeIndex(self.count.shape[2], name='platform_mask')
+        elif by == 'price_bucket':
+            index = pd.Index(PRICE_LABELS, name='price_bucket')
+        else:
+            raise ValueError(f"unknown cube dimension {by!r}")
+        return self._stats(*self._reduce(by, genre), index)
+
+    def by_year(self, genre=None):
+        """Per release year statistics (games without a year left out)"""
+        stats = self.summary('year', genre)
+        return stats[(stats.index != UNKNOWN) & (stats['count'] > 0)]
+
+    def _group_masks(self, groups, genre=None):
+        """Statistics for named groups of platform masks"""
+        arrays = self._reduce('platform_mask', genre)
+        combined = [
+            np.stack([a[..., masks].sum(axis=-1) for masks in groups.values()], axis=-1)
+            for a in arrays
+        ]
+        return self._stats(*combined, pd.Index(list(groups)))
+
+    def by_platform(self, genre=None):
+        """Per platform statistics; a game counts towards every platform it supports"""
+        masks = range(self.count.shape[2])
+        groups = {
+            platform: [mask for mask in masks if mask & (1 << bit)]
+            for bit, platform in enumerate(PLATFORMS)
+        }
+        return self._group_masks(groups, genre).rename_axis('platform')
+
+    def by_platform_category(self, genre=None):
+        """Statistics per platform category (Windows Only, All Platforms, ...)"""
+        groups = {}
+        for mask in range(self.count.shape[2]):
+            groups.setdefault(platform_category(mask), []).append(mask)
+        stats = self._group_masks(groups, genre).rename_axis('platform_category')
+        return stats[stats['count'] > 0].sort_index()
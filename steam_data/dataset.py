@@ -0,0 +1,35 @@
+"""
+DATASET PREPARATION
+Derived columns shared by the dashboard and the snapshot cache
+"""
+
+import pandas as pd
+
+from .genre_codes import GenreCodes
+from .schema import apply_schema
+
+RAW_CSV = 'data/raw/steam_games.csv'
+
+
+def prepare_dataset(df):
+    """Add the derived columns the dashboard works with"""
+    df['Release date'] = pd.to_datetime(df['Release date'], errors='coerce')
+    df['Release_Year'] = df['Release date'].dt.year
+    df['total_reviews'] = df['Positive'] + df['Negative']
+    df['positive_rate'] = (df['Positive'] / df['total_reviews'] * 100).round(2)
+    df['platform_count'] = df[['Windows', 'Mac', 'Linux']].sum(axis=1)
+
+    # Clean genres
+    df['Genres'] = df['Genres'].fillna('Unknown')
+    # Integer codes + offsets (Arrow list<dictionary>), not a Python list per row
+    df['genre_list'] = GenreCodes.from_strings(df['Genres']).to_series(df.index)
+
+    # Developer cleanup
+    df['Main_Developer'] = df['Developers'].str.split(',').str[0].str.strip()
+
+    return df
+
+
+def read_raw_dataset(csv_path=RAW_CSV):
+    """Parse the raw CSV, derive all dashboard columns and apply the compact schema"""
+    return apply_schema(prepare_dataset(pd.read_csv(csv_path)))
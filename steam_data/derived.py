@@ -0,0 +1,62 @@
+"""
+DERIVED PAGE COLUMNS
+Page-specific scores computed into standalone arrays instead of being
+assigned onto the shared dataset, which is read-only and shared by every
+dashboard session. Includes the confidence-adjusted ratings used to rank
+games, which keep a 100% score from two reviews off the leaderboards
+"""
+
+import numpy as np
+
+# z for a 95% Wilson interval
+WILSON_Z = 1.96
+
+# Bayesian average prior: this many pseudo-reviews at the catalog rate
+PRIOR_REVIEWS = 50
+
+
+def success_scores(df):
+    """Combined success score: 40% positive rate, 60% log review count (scaled to 0-100)"""
+    rate = df['positive_rate'].to_numpy(dtype=float)
+    reviews = np.log1p(df['total_reviews'].to_numpy(dtype=float))
+    return rate * 0.4 + reviews / np.nanmax(reviews) * 100 * 0.6
+
+
+def success_mask(scores, quantile=0.9):
+    """Games at or above the given quantile of the success score"""
+    threshold = np.nanquantile(scores, quantile)
+    with np.errstate(invalid='ignore'):
+        return scores >= threshold
+
+
+def wilson_lower_bound(positive, total, z=WILSON_Z):
+    """Lower bound of the Wilson score interval of the positive share, in percent (NaN without reviews)"""
+    positive = np.asarray(positive, dtype=float)
+    total = np.asarray(total, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        p = positive / total
+        centre = p + z * z / (2 * total)
+        margin = z * np.sqrt(p * (1 - p) / total + z * z / (4 * total * total))
+        bound = (centre - margin) / (1 + z * z / total)
+    return np.where(total > 0, bound * 100, np.nan)
+
+
+def bayesian_average(positive, total, prior_rate=None, prior_reviews=PRIOR_REVIEWS):
+    """Positive share shrunk toward prior_rate (default: the catalog share) by prior_reviews pseudo-reviews, in percent"""
+    positive = np.asarray(positive, dtype=float)
+    total = np.asarray(total, dtype=float)
+    if prior_rate is None:
+        prior_rate = np.nansum(positive) / np.nansum(total)
+    with np.errstate(invalid='ignore'):
+        score = (positive + prior_rate * prior_reviews) / (total + prior_reviews)
+    return np.where(total > 0, score * 100, np.nan)
+
+
+def rating_scores(df, prior_reviews=PRIOR_REVIEWS):
+    """Confidence-adjusted ratings per game, keyed by the name they are ranked under"""
+    positive = df['Positive'].to_numpy(dtype=float)
+    total = df['total_reviews'].to_numpy(dtype=float)
+    return {
+        'wilson_score': wilson_lower_bound(positive, total),
+        'bayesian_score': bayesian_average(positive, total, prior_reviews=prior_reviews)
+    }
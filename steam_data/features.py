@@ -0,0 +1,56 @@
+"""
+CANONICAL FEATURE TABLE
+Parses the raw CSV once and stores every column the data preparation
+scripts derive (review rate, release date parts, main developer, genres)
+as a Parquet file, so each script only reads the columns it needs
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from .dataset import RAW_CSV
+
+FEATURES_PATH = 'data/processed/steam_features.parquet'
+
+
+def derive_features(df):
+    """Add the derived columns shared by the prepare_*.py scripts"""
+    # Release date parts (NaN when the date cannot be parsed)
+    df['Release date'] = pd.to_datetime(df['Release date'], errors='coerce')
+    df['release_year'] = df['Release date'].dt.year
+    df['release_month'] = df['Release date'].dt.month
+    df['release_quarter'] = df['Release date'].dt.quarter
+
+    # Review metrics (positive_rate is NaN for games without reviews)
+    df['total_reviews'] = df['Positive'] + df['Negative']
+    df['positive_rate'] = df['Positive'] / df['total_reviews'] * 100
+
+    # First listed developer
+    df['Main_Developer'] = df['Developers'].str.split(',').str[0].str.strip()
+
+    # Platforms and genres
+    df['platform_count'] = df[['Windows', 'Mac', 'Linux']].sum(axis=1)
+    df['genre_list'] = df['Genres'].str.split(',').map(
+        lambda genres: [g.strip() for g in genres] if isinstance(genres, list) else []
+    )
+    df['genre_count'] = df['Genres'].str.split(',').str.len()
+
+    return df
+
+
+def build_feature_table(csv_path=RAW_CSV, out_path=FEATURES_PATH):
+    """Parse the raw CSV once and write the canonical feature table"""
+    df = derive_features(pd.read_csv(csv_path))
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(out_path, index=False)
+    print(f"✓ Feature table: {out_path} ({len(df):,} games, {len(df.columns)} columns)")
+    return df
+
+
+def load_features(columns=None, path=FEATURES_PATH, csv_path=RAW_CSV):
+    """Read selected columns of the feature table, building it if missing"""
+    if not Path(path).exists():
+        build_feature_table(csv_path, path)
+    return pd.read_parquet(path, columns=columns)
@@ -0,0 +1,102 @@
+"""
+FILTER ENGINE
+Range filters over numeric columns answered from presorted index arrays. Each
+column keeps an argsort of its values, so a (low, high) predicate is two
+binary searches and a slice. A query starts from the most selective
+predicate and checks the remaining ones only on the surviving rows, so no
+full-frame boolean masks are built
+"""
+
+import numpy as np
+
+# Numeric columns the dashboard filters on
+FILTER_COLUMNS = ['Price', 'total_reviews', 'positive_rate', 'Release_Year']
+
+# Boolean columns that can be combined with an "any of" filter
+FLAG_COLUMNS = ['Windows', 'Mac', 'Linux']
+
+
+class FilterEngine:
+    """Sorted-column indexes plus a query(filters) -> row positions API"""
+
+    def __init__(self, df, columns=FILTER_COLUMNS, flags=FLAG_COLUMNS, genre_index=None):
+        self.n_rows = len(df)
+        self.values = {}
+        self.order = {}
+        self.sorted_values = {}
+        for col in columns:
+            values = df[col].to_numpy(dtype=float)
+            # NaNs sort last and are cut off, so they never satisfy a range
+            order = np.argsort(values, kind='stable')
+            n_valid = int((~np.isnan(values)).sum())
+            self.values[col] = values
+            self.order[col] = order[:n_valid]
+            self.sorted_values[col] = values[order[:n_valid]]
+
+        self.flags = {col: df[col].fillna(False).to_numpy(dtype=bool) for col in flags}
+        self.genre_index = genre_index
+
+    def __len__(self):
+        return self.n_rows
+
+    def bounds(self, column, low=None, high=None):
+        """Slice of the sorted index holding low <= value <= high"""
+        sorted_values = self.sorted_values[column]
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+        stop = len(sorted_values) if high is None else np.searchsorted(sorted_values, high, side='right')
+        return start, max(start, stop)
+
+    def range(self, column, low=None, high=None):
+        """Sorted row positions with low <= column <= high (None = unbounded)"""
+        start, stop = self.bounds(column, low, high)
+        return np.sort(self.order[column][start:stop])
+
+    def query(self, filters):
+        """Sorted row positions matching every filter
+
+        filters maps a numeric column to a (low, high) range (either end may
+        be None), plus the optional keys 'platforms' (flag columns, any of),
+        'genres' (genre names) and 'genre_mode' ('any' or 'all').
+        """
+        filters = dict(filters)
+        platforms = filters.pop('platforms', None)
+        genres = filters.pop('genres', None)
+        genre_mode = filters.pop('genre_mode', 'any')
+
+        ranges = []
+        for column, (low, high) in filters.items():
+            start, stop = self.bounds(column, low, high)
+            ranges.append((stop - start, column, low, high))
+        ranges.sort(key=lambda r: r[0])
+
+        # Materialize the most selective range, then narrow it down
+        if ranges:
+            _, column, low, high = ranges[0]
+            rows = self.range(column, low, high)
+        else:
+            rows = np.arange(self.n_rows)
+
+        for _, column, low, high in ranges[1:]:
+            if len(rows) == 0:
+                break
+            values = self.values[column][rows]
+            keep = ~np.isnan(values)
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+            rows = rows[keep]
+
+        if platforms:
+            rows = rows[np.logical_or.reduce([self.flags[p][rows] for p in platforms])]
+
+        if genres and self.genre_index is not None:
+            rows = rows[self.genre_index.mask(genres, genre_mode)[rows]]
+
+        return rows
+
+    def mask(self, filters):
+        """Boolean row mask equivalent of query(filters)"""
+        selected = np.zeros(self.n_rows, dtype=bool)
+        selected[self.query(filters)] = True
+        return selected
@@ -0,0 +1,87 @@
+"""
+FUZZY GAME SEARCH
+Typo-tolerant, ranked name search. Names and queries are reduced to their
+case-folded letters and digits ("Counter-Strike" -> "counterstrike"), games
+sharing trigrams with the query are scored from the posting lists alone,
+and results are ranked by match quality with review count as a tie-breaker
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from .text_index import TrigramIndex, trigrams
+
+_NON_ALNUM = re.compile(r'[\W_]+')
+
+# Share of the query's trigrams a game must contain to be considered a match
+MIN_RECALL = 0.5
+
+# Weight of popularity (log review count, scaled to 0-1) in the final score
+POPULARITY_WEIGHT = 0.15
+
+
+def normalize_name(text):
+    """Case-folded letters and digits only"""
+    return _NON_ALNUM.sub('', text.casefold()) if isinstance(text, str) else ''
+
+
+class FuzzySearch:
+    """Ranked, typo-tolerant top-k search over game names"""
+
+    def __init__(self, names, popularity):
+        self.index = TrigramIndex([normalize_name(name) for name in names])
+        self.gram_counts = np.bincount(self.index.postings, minlength=len(self.index))
+
+        popularity = np.log1p(np.nan_to_num(np.asarray(popularity, dtype=float)))
+        self.popularity = popularity / popularity.max() if popularity.max() > 0 else popularity
+
+    @classmethod
+    def from_frame(cls, df, name_col='Name', popularity_col='total_reviews'):
+        return cls(df[name_col].tolist(), df[popularity_col].to_numpy())
+
+    def search(self, query, k=20):
+        """Top-k matches as a DataFrame of row positions and scores (best first)"""
+        query = normalize_name(query)
+        if not query:
+            return pd.DataFrame({'row': np.array([], dtype=np.int64), 'score': np.array([])})
+
+        if len(query) < 3:
+            # Too short to score by trigrams: prefix hits ranked by popularity
+            rows = self.index.prefix(query).astype(np.int64)
+            quality = np.ones(len(rows))
+        else:
+            rows, quality = self._score(query)
+
+        score = quality + POPULARITY_WEIGHT * self.popularity[rows]
+        top = np.argsort(-score, kind='stable')[:k]
+        return pd.DataFrame({'row': rows[top], 'score': np.round(score[top], 4)})
+
+    def _score(self, query):
+        query_grams = trigrams(query)
+        postings = [self.index.posting(gram) for gram in query_grams]
+        postings = [p for p in postings if p is not None]
+        if not postings:
+            return np.array([], dtype=np.int64), np.array([])
+
+        # Shared trigram count per candidate, straight from the posting lists
+        rows, shared = np.unique(np.concatenate(postings), return_counts=True)
+        recall = shared / len(query_grams)
+        keep = recall >= MIN_RECALL
+        rows, shared, recall = rows[keep], shared[keep], recall[keep]
+
+        # Dice coefficient penalizes long titles that merely contain the query
+        dice = 2 * shared / (len(query_grams) + self.gram_counts[rows])
+        quality = 0.6 * recall + 0.4 * dice
+
+        # Exact (normalized) substring and prefix hits rank above fuzzy ones
+        # (only candidates holding every query trigram can contain the query)
+        texts = self.index.texts
+        contains = np.zeros(len(rows), dtype=bool)
+        prefix = np.zeros(len(rows), dtype=bool)
+        for i in np.flatnonzero(shared == len(query_grams)):
+            contains[i] = query in texts[rows[i]]
+            prefix[i] = texts[rows[i]].startswith(query)
+        quality = quality + 0.3 * contains + 0.1 * prefix
+        return rows.astype(np.int64), quality
@@ -0,0 +1,89 @@
+"""
+GAME LOOKUP
+Constant-time resolution of a selected game. AppID is the primary key
+(AppID -> row position), and a normalized-name multimap lists every AppID
+sharing a name, most-reviewed first, so pickers can store AppIDs and show
+duplicate names with enough detail to tell them apart
+"""
+
+import numpy as np
+import pandas as pd
+
+from .fuzzy_search import normalize_name
+
+
+def name_key(name):
+    """Multimap key: normalize_name, or the case-folded name when that leaves nothing"""
+    return normalize_name(name) or name.casefold()
+
+
+class GameLookup:
+    """AppID primary-key index plus a normalized-name -> AppIDs multimap"""
+
+    def __init__(self, app_ids, names, popularity=None, details=None):
+        self.app_ids = np.asarray(app_ids, dtype=np.int64)
+        self.names = ['' if pd.isna(name) else str(name) for name in names]
+        self.details = details
+
+        # First occurrence wins if an AppID is ever repeated
+        self.row_of = {}
+        for row, app_id in enumerate(self.app_ids.tolist()):
+            self.row_of.setdefault(app_id, row)
+
+        popularity = np.nan_to_num(np.asarray(
+            popularity if popularity is not None else np.zeros(len(self.app_ids)), dtype=float
+        ))
+        self.by_name = {}
+        for row in np.argsort(-popularity, kind='stable').tolist():
+            self.by_name.setdefault(name_key(self.names[row]), []).append(int(self.app_ids[row]))
+
+    @classmethod
+    def from_frame(cls, df):
+        """Index over a dataset frame (release year and main developer disambiguate names)"""
+        details = [
+            ', '.join(str(part) for part in parts if not pd.isna(part))
+            for parts in zip(df['Release_Year'].astype('Int64'), df['Main_Developer'])
+        ]
+        return cls(df['AppID'], df['Name'], df['total_reviews'], details)
+
+    def __len__(self):
+        return len(self.app_ids)
+
+    def __contains__(self, app_id):
+        return app_id in self.row_of
+
+    def row(self, app_id):
+        """Row position of app_id (None if unknown)"""
+        return self.row_of.get(app_id)
+
+    def rows(self, app_ids):
+        """Row positions of the known app_ids, in the given order"""
+        rows = [self.row_of[app_id] for app_id in app_ids if app_id in self.row_of]
+        return np.array(rows, dtype=np.int64)
+
+    def app_ids_for(self, name):
+        """AppIDs of every game with this name (case and punctuation ignored), most-reviewed first"""
+        return list(self.by_name.get(name_key(name), []))
+
+    def same_name_rows(self, app_id):
+        """Row positions of app_id and every other game sharing its name"""
+        row = self.row(app_id)
+        if row is None:
+            return np.array([], dtype=np.int64)
+        return self.rows(self.app_ids_for(self.names[row]))
+
+    def is_duplicate(self, app_id):
+        """Whether another game shares this game's name"""
+        row = self.row(app_id)
+        return row is not None and len(self.by_name[name_key(self.names[row])]) > 1
+
+    def label(self, app_id):
+        """Display name; duplicated names get their year, developer and AppID"""
+        row = self.row(app_id)
+        if row is None:
+            return str(app_id)
+        name = self.names[row]
+        if not self.is_duplicate(app_id):
+            return name
+        detail = f"{self.details[row]}, " if self.details is not None and self.details[row] else ''
+        return f"{name} ({detail}AppID {app_id})"
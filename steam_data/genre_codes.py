@@ -0,0 +1,76 @@
+"""
+GENRE CODE ARRAYS
+Per-game genres as one integer code array plus row offsets, the layout of
+an Arrow list<dictionary<string>> column: the genres of row i are
+vocab[codes[offsets[i]:offsets[i + 1]]]. GenreIndex.from_codes builds the
+genre filters and aggregates straight from these arrays, so no Python list
+per row is built, pickled or exploded
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+class GenreCodes:
+    """Integer genre codes with CSR-style row offsets"""
+
+    def __init__(self, vocab, codes, offsets):
+        self.vocab = list(vocab)
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+
+    @classmethod
+    def from_strings(cls, genres, sep=','):
+        """Split comma-separated genre strings (whitespace stripped, empty items dropped)"""
+        strings = pa.array(pd.Series(genres).fillna('').astype(str).tolist(), type=pa.string())
+        lists = pc.split_pattern(strings, sep)
+        items = pc.utf8_trim_whitespace(lists.flatten())
+
+        # Drop empty items and recount the genres per row
+        keep = np.asarray(pc.not_equal(items, ''), dtype=bool)
+        lengths = np.diff(np.asarray(lists.offsets))
+        row_ids = np.repeat(np.arange(len(lengths)), lengths)
+        kept_per_row = np.bincount(row_ids[keep], minlength=len(lengths))
+        offsets = np.concatenate([[0], np.cumsum(kept_per_row)])
+
+        encoded = items.filter(pa.array(keep)).dictionary_encode()
+        return cls(encoded.dictionary.to_pylist(), np.asarray(encoded.indices), offsets)
+
+    @classmethod
+    def from_column(cls, column):
+        """From a list<dictionary<string>> column (pandas ArrowDtype or Arrow array)"""
+        array = pa.array(column.array) if isinstance(column, pd.Series) else column
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks()
+        values = array.flatten()  # respects slicing, unlike .values
+        offsets = np.asarray(array.offsets) - array.offsets[0].as_py()
+        return cls(values.dictionary.to_pylist(), np.asarray(values.indices), offsets)
+
+    def to_arrow(self):
+        """The codes as an Arrow list<dictionary<string>> array"""
+        values = pa.DictionaryArray.from_arrays(pa.array(self.codes), pa.array(self.vocab, type=pa.string()))
+        return pa.ListArray.from_arrays(pa.array(self.offsets, type=pa.int32()), values)
+
+    def to_series(self, index=None):
+        """pandas column backed by the Arrow list<dictionary<string>> array"""
+        return pd.Series(pd.arrays.ArrowExtensionArray(self.to_arrow()), index=index)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def lengths(self):
+        """Number of genres per row"""
+        return np.diff(self.offsets)
+
+    def row_ids(self):
+        """Row of every code (the explode index, without exploding)"""
+        return np.repeat(np.arange(len(self)), self.lengths())
+
+    def first(self):
+        """First genre code per row (-1 for rows without genres)"""
+        first = np.full(len(self), -1, dtype=np.int32)
+        has_genres = self.lengths() > 0
+        first[has_genres] = self.codes[self.offsets[:-1][has_genres]]
+        return first
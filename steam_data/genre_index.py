@@ -0,0 +1,90 @@
+"""
+GENRE BITSET INDEX
+Genre vocabulary plus one packed bitset per genre over the dataset rows, so
+multi-genre "any of" / "all of" filters are a few vectorized bitwise ops.
+A sparse genre x game incidence matrix answers per-genre counts, sums and
+means with sparse matrix-vector products instead of DataFrame.explode
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class GenreIndex:
+    """Per-genre row bitsets and incidence matrix, aligned with the source frame rows"""
+
+    def __init__(self, genres, bitsets, incidence, n_rows):
+        self.genres = list(genres)
+        self.bitsets = bitsets  # uint8 array, shape (n_genres, ceil(n_rows / 8))
+        self.incidence = incidence  # CSR 0/1 matrix, shape (n_genres, n_rows)
+        self.n_rows = n_rows
+        self._position = {genre: i for i, genre in enumerate(self.genres)}
+
+    @classmethod
+    def from_codes(cls, genre_codes):
+        """Build from a GenreCodes code/offset array (no per-row lists)"""
+        n_rows = len(genre_codes)
+        genres = sorted(genre_codes.vocab)
+        # Re-number codes so genres come out in sorted order
+        remap = np.argsort(np.argsort(genre_codes.vocab, kind='stable'), kind='stable')
+        codes = remap[genre_codes.codes]
+        rows = genre_codes.row_ids()
+
+        matrix = np.zeros((len(genres), n_rows), dtype=bool)
+        matrix[codes, rows] = True
+
+        incidence = sparse.csr_matrix(
+            (np.ones(len(rows)), (codes, rows)), shape=(len(genres), n_rows)
+        )
+        incidence.sum_duplicates()
+        incidence.data[:] = 1.0  # a genre listed twice still counts once
+        return cls(genres, np.packbits(matrix, axis=1), incidence, n_rows)
+
+    def mask(self, selected, mode='any'):
+        """Boolean row mask for games having any / all of the selected genres"""
+        if not selected:
+            return np.ones(self.n_rows, dtype=bool)
+
+        known = [self._position[g] for g in selected if g in self._position]
+        if mode == 'all':
+            if len(known) < len(set(selected)):
+                return np.zeros(self.n_rows, dtype=bool)
+            combined = np.bitwise_and.reduce(self.bitsets[known], axis=0)
+        elif mode == 'any':
+            if not known:
+                return np.zeros(self.n_rows, dtype=bool)
+            combined = np.bitwise_or.reduce(self.bitsets[known], axis=0)
+        else:
+            raise ValueError(f"mode must be 'any' or 'all', got {mode!r}")
+
+        return np.unpackbits(combined, count=self.n_rows).astype(bool)
+
+    def counts(self):
+        """Number of games per genre as a Series"""
+        per_genre = np.unpackbits(self.bitsets, axis=1, count=self.n_rows).sum(axis=1)
+        return pd.Series(per_genre, index=self.genres)
+
+    def aggregate(self, frame, columns, rows=None):
+        """Per-genre game count plus sum and mean of each column
+
+        frame must have the same row order as the index; rows optionally
+        restricts the games (boolean mask or positional indices).
+        """
+        weights = np.ones(self.n_rows)
+        if rows is not None:
+            selected = np.zeros(self.n_rows)
+            selected[rows] = 1.0
+            weights = selected
+
+        stats = pd.DataFrame({'count': self.incidence @ weights}, index=self.genres)
+        for col in columns:
+            values = frame[col].to_numpy(dtype=float)
+            valid = ~np.isnan(values) * weights
+            sums = self.incidence @ np.where(valid > 0, values, 0.0)
+            valid_counts = self.incidence @ valid
+            stats[f'{col}_sum'] = sums
+            with np.errstate(invalid='ignore', divide='ignore'):
+                stats[f'{col}_mean'] = sums / valid_counts
+        stats.index.name = 'genre'
+        return stats
@@ -0,0 +1,142 @@
+"""
+RANGE AGGREGATES
+Summed-area tables for the Home summary metrics. Games are binned on a
+release year x price x minimum-rating grid whose bins line up with the
+integer slider values, and cumulative sums over the grid turn any slider
+box into an 8-corner lookup. Results are exact; filters the grid cannot
+express (platforms, genres, a minimum review count, off-grid bounds) return
+None so the caller falls back to the filtered rows. Only one table is kept,
+as it costs tens of MB
+"""
+
+import numpy as np
+
+# Slider extents covered by the grid (rows outside can never match a Home filter)
+YEAR_RANGE = (1997, 2023)
+PRICE_MAX = 100
+
+# Measures summed per cell
+MEASURES = ['count', 'price_sum', 'rating_sum', 'reviews_sum', 'playtime_sum', 'playtime_n']
+
+
+class RangeAggregates:
+    """O(1) count / sums / means for price, rating and year slider ranges"""
+
+    def __init__(self, df, year_range=YEAR_RANGE, price_max=PRICE_MAX):
+        self.year_range = year_range
+        self.price_max = price_max
+
+        year = df['Release_Year'].to_numpy(dtype=float)
+        price = df['Price'].to_numpy(dtype=float)
+        rating = df['positive_rate'].to_numpy(dtype=float)
+        reviews = df['total_reviews'].to_numpy(dtype=float)
+        playtime = df['Median playtime forever'].to_numpy(dtype=float)
+
+        # Rows that can match some slider setting (NaNs never pass a range)
+        with np.errstate(invalid='ignore'):
+            on_grid = (
+                (year >= year_range[0]) & (year <= year_range[1]) &
+                (price >= 0) & (price <= price_max) &
+                (rating >= 0) & ~np.isnan(reviews)
+            )
+        self.reviews_complete = not np.isnan(reviews).any()
+
+        # Price: integer k -> 2k, (k, k + 1) -> 2k + 1, so price >= lo and
+        # price <= hi are exact cuts at 2 * lo and 2 * hi
+        floor = np.floor(np.nan_to_num(price))
+        year_code = np.nan_to_num(year - year_range[0]).astype(np.int64)
+        price_code = (2 * floor + (np.nan_to_num(price) > floor)).astype(np.int64)
+        # Rating only has a lower bound on Home: rating >= t  <=>  floor(rating) >= t
+        rating_code = np.floor(np.nan_to_num(rating)).clip(0, 100).astype(np.int64)
+
+        self.shape = (year_range[1] - year_range[0] + 1, 2 * price_max + 1, 101)
+        values = np.stack([
+            np.ones(len(df)),
+            np.nan_to_num(price),
+            np.nan_to_num(rating),
+            np.nan_to_num(reviews),
+            np.nan_to_num(playtime),
+            ~np.isnan(playtime)
+        ])[:, on_grid]
+        cells = np.ravel_multi_index(
+            (year_code[on_grid], price_code[on_grid], rating_code[on_grid]), self.shape
+        )
+        size = int(np.prod(self.shape))
+
+        # Zero-padded cumulative sums per measure
+        self.table = np.zeros((len(MEASURES),) + tuple(n + 1 for n in self.shape))
+        for m in range(len(MEASURES)):
+            grid = np.bincount(cells, weights=values[m], minlength=size).reshape(self.shape)
+            self.table[m, 1:, 1:, 1:] = grid.cumsum(0).cumsum(1).cumsum(2)
+
+    def _box(self, filters):
+        """Grid box [start, stop) per axis for filters, or None if off-grid"""
+        filters = dict(filters)
+        if filters.pop('genres', None):
+            return None
+        filters.pop('genre_mode', None)
+        if filters.pop('platforms', None):
+            return None
+
+        low, high = filters.pop('total_reviews', (None, None))
+        if (low is not None and low > 0) or high is not None:
+            return None
+        if low is None and not self.reviews_complete:
+            return None
+
+        try:
+            year_lo, year_hi = filters.pop('Release_Year')
+            price_lo, price_hi = filters.pop('Price')
+            rating_lo, rating_hi = filters.pop('positive_rate')
+        except KeyError:
+            return None
+        if filters:
+            return None
+
+        bounds = [year_lo, year_hi, price_lo, price_hi, rating_lo]
+        if any(b is None or b != int(b) for b in bounds):
+            return None
+        if not (self.year_range[0] <= year_lo and year_hi <= self.year_range[1]):
+            return None
+        if not (0 <= price_lo and price_hi <= self.price_max and 0 <= rating_lo <= 100):
+            return None
+        if rating_hi is not None and rating_hi < 100:
+            return None
+
+        return (
+            (int(year_lo) - self.year_range[0], int(year_hi) - self.year_range[0] + 1),
+            (2 * int(price_lo), 2 * int(price_hi) + 1),
+            (int(rating_lo), 101)
+        )
+
+    def totals(self, filters):
+        """Per-measure sums for a filter dict (FilterEngine keys), or None if unsupported"""
+        box = self._box(filters)
+        if box is None:
+            return None
+        (y0, y1), (p0, p1), (r0, r1) = box
+        if y0 >= y1 or p0 >= p1:
+            return dict.fromkeys(MEASURES, 0.0)
+
+        t = self.table
+        # Inclusion-exclusion over the 8 corners of the box
+        sums = (
+            t[:, y1, p1, r1] - t[:, y0, p1, r1] - t[:, y1, p0, r1] - t[:, y1, p1, r0]
+            + t[:, y0, p0, r1] + t[:, y0, p1, r0] + t[:, y1, p0, r0] - t[:, y0, p0, r0]
+        )
+        return dict(zip(MEASURES, sums))
+
+    def metrics(self, filters):
+        """Home summary metrics for filters, or None if the grid cannot answer them"""
+        sums = self.totals(filters)
+        if sums is None:
+            return None
+        count = int(round(sums['count']))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return {
+                'count': count,
+                'avg_price': sums['price_sum'] / count if count else np.nan,
+                'avg_rating': sums['rating_sum'] / count if count else np.nan,
+                'total_reviews': int(round(sums['reviews_sum'])),
+                'avg_playtime': sums['playtime_sum'] / sums['playtime_n'] if sums['playtime_n'] else np.nan
+            }
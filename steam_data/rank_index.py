@@ -0,0 +1,109 @@
+"""
+RANK INDEX
+Leaderboards answered from arrays sorted once per dataset version. Every
+ranking column keeps a stable descending argsort (NaN last, ties in row
+order, like nlargest) and the rank of each row in it, so a top-k is a slice
+of the order and a top-k under a filter only ranks the surviving rows.
+Derived scores (such as the confidence-adjusted ratings) are ranked the same
+way under their own names. Group columns keep their value counts and row
+lists for developer pickers. Each column is ranked the first time a page
+asks for it, so a page only pays for the leaderboards it shows
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Columns leaderboards and table sorts rank on
+RANK_COLUMNS = ['positive_rate', 'total_reviews', 'Price', 'Median playtime forever', 'Release_Year', 'Name']
+
+# Columns whose most frequent values feed pickers
+GROUP_COLUMNS = ['Main_Developer']
+
+
+class RankIndex:
+    """Presorted orders and rank arrays per column, plus group counts"""
+
+    def __init__(self, df, columns=RANK_COLUMNS, groups=GROUP_COLUMNS, scores=None):
+        self.n_rows = len(df)
+        self.values = {col: df[col] for col in columns}
+        self.values.update({name: pd.Series(values) for name, values in (scores or {}).items()})
+        self.groups = {col: df[col] for col in groups}
+        self._ranked = {}  # (name, ascending) -> (order, rank)
+        self._grouped = {}  # group column -> (value counts, rows per value)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.n_rows
+
+    def _ranking(self, name, ascending):
+        """(order, rank) arrays for a column or score, built on first use"""
+        key = (name, ascending)
+        ranking = self._ranked.get(key)
+        if ranking is None:
+            values = self.values[name]
+            if not pd.api.types.is_numeric_dtype(values):
+                values = values.astype(object)
+            # method='first' breaks ties by row order; NaNs rank last either way
+            rank = values.rank(method='first', ascending=ascending, na_option='bottom')
+            rank = rank.to_numpy(dtype=np.int64) - 1
+            order = np.empty_like(rank)
+            order[rank] = np.arange(len(rank))
+            with self._lock:
+                ranking = self._ranked.setdefault(key, (order, rank))
+        return ranking
+
+    def _grouping(self, column):
+        """(value counts, rows per value) of a group column, built on first use"""
+        grouping = self._grouped.get(column)
+        if grouping is None:
+            series = self.groups[column]
+            codes, uniques = pd.factorize(series)
+            # Rows grouped by value, in row order within each group
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            rows = {value: order[bounds[i]:bounds[i + 1]] for i, value in enumerate(uniques)}
+            with self._lock:
+                grouping = self._grouped.setdefault(column, (series.value_counts(), rows))
+        return grouping
+
+    def order(self, column, ascending=False):
+        """Row positions sorted by column"""
+        return self._ranking(column, ascending)[0]
+
+    def rank(self, column, ascending=False):
+        """Position of each row in order(column)"""
+        return self._ranking(column, ascending)[1]
+
+    def top_k(self, column, k, rows=None, ascending=False):
+        """Positions of the first k rows by column (optionally only among rows)"""
+        if rows is None:
+            return self.order(column, ascending)[:k]
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        ranks = self.rank(column, ascending)[rows]
+        if k < len(rows):
+            head = np.argpartition(ranks, k)[:k]
+            return rows[head[np.argsort(ranks[head])]]
+        return rows[np.argsort(ranks)]
+
+    def sort(self, rows, column, ascending=True):
+        """rows reordered by column (NaN last, stable)"""
+        rows = np.asarray(rows)
+        if len(rows) * 8 > self.n_rows:
+            # Large selections: walk the presorted order instead of sorting
+            mask = np.zeros(self.n_rows, dtype=bool)
+            mask[rows] = True
+            order = self.order(column, ascending)
+            return order[mask[order]]
+        return self.top_k(column, len(rows), rows, ascending)
+
+    def top_groups(self, column, k):
+        """The k most frequent values of a group column"""
+        return self._grouping(column)[0].head(k).index.tolist()
+
+    def rows_of(self, column, value):
+        """Positions of the rows where column equals value"""
+        return self._grouping(column)[1].get(value, np.array([], dtype=np.int64))
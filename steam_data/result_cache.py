@@ -0,0 +1,105 @@
+"""
+FILTER RESULT CACHE
+Process-wide LRU memo of filter results (selected row positions plus any
+derived metrics), keyed by a canonical hash of the filter state and bounded
+by a byte budget. One instance is shared by every dashboard session, and it
+counts hits, misses and evictions so the hit rate can be reported
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Default memory budget for cached results
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _canonical(value):
+    """JSON-serializable form of a filter value (tuples/sets -> lists, sets sorted)"""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def filter_key(filters):
+    """Stable hash of a filter state; equal states always hash the same"""
+    payload = json.dumps(_canonical(filters), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _size_of(value):
+    """Approximate bytes held by a cached value"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_size_of(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_size_of(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """Thread-safe LRU cache with a byte budget and hit/miss/eviction counters"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, filters, compute):
+        """Cached result for filters, calling compute() on a miss"""
+        key = filter_key(filters)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = compute()
+        size = _size_of(value)
+        with self._lock:
+            if key in self._entries or size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+        return value
+
+    def stats(self):
+        """Hit rate, counters and memory use"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
@@ -0,0 +1,69 @@
+"""
+CHART SAMPLER
+Seeded, optionally stratified row samples drawn from a filtered index. The
+same filters, size and strata always give the same rows, so reruns don't
+reshuffle the charts, and samples are memoized per (filter state, size,
+strata)
+"""
+
+import numpy as np
+import pandas as pd
+
+from .cube import PRICE_EDGES
+from .genre_codes import GenreCodes
+from .result_cache import ResultCache, filter_key
+
+# Strata a sample can be balanced over
+STRATA = ['year', 'price_bucket', 'genre']
+
+
+def stratified_sample(rows, codes, size, rng):
+    """size positions from rows, allocated to strata in proportion to their share
+
+    Seats are handed out by largest remainder, so the sample size is exact
+    and every stratum keeps its share to within one row.
+    """
+    strata, inverse, counts = np.unique(codes[rows], return_inverse=True, return_counts=True)
+    quota = counts * size / len(rows)
+    seats = np.floor(quota).astype(int)
+    remainder = size - seats.sum()
+    if remainder:
+        seats[np.argsort(-(quota - seats), kind='stable')[:remainder]] += 1
+
+    order = np.argsort(inverse, kind='stable')
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    picked = [
+        rng.choice(rows[order[bounds[s]:bounds[s + 1]]], seats[s], replace=False)
+        for s in range(len(strata)) if seats[s]
+    ]
+    return np.concatenate(picked) if picked else np.array([], dtype=np.int64)
+
+
+class Sampler:
+    """Deterministic, cached chart samples over the rows of one frame"""
+
+    def __init__(self, df, cache=None, seed=0):
+        self.cache = cache if cache is not None else ResultCache()
+        self.seed = seed
+
+        price = df['Price'].to_numpy(dtype=float)
+        self.codes = {
+            'year': pd.factorize(df['Release_Year'], use_na_sentinel=False)[0],
+            'price_bucket': np.searchsorted(PRICE_EDGES, np.nan_to_num(price).clip(0), side='right') - 1,
+            'genre': GenreCodes.from_column(df['genre_list']).first()
+        }
+
+    def sample(self, rows, size, strata=None, filters=None):
+        """Sorted row positions: at most size rows of rows, balanced over strata"""
+        rows = np.asarray(rows)
+        size = min(size, len(rows))
+        key = {'size': size, 'strata': strata, 'seed': self.seed, 'filters': filter_key(filters or {})}
+
+        def compute():
+            rng = np.random.default_rng(self.seed)
+            if size == len(rows):
+                return np.sort(rows)
+            if strata is None:
+                return np.sort(rng.choice(rows, size, replace=False))
+            return np.sort(stratified_sample(rows, self.codes[strata], size, rng))
+        return self.cache.get_or_compute(key, compute)
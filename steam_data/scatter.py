@@ -0,0 +1,89 @@
+"""
+DENSITY-AWARE SCATTER
+Decides how a scatter of n points should be drawn. Up to a threshold every
+point is sent (for WebGL rendering); past it the points are binned into a
+2D count grid on the server, and only the points in sparse cells, the
+outliers a density surface would hide, are sent individually
+"""
+
+import numpy as np
+
+from .result_cache import ResultCache, filter_key
+
+# Largest point count drawn point by point
+POINT_THRESHOLD = 20000
+
+# Density grid resolution per axis
+GRID_BINS = 150
+
+# Points in cells holding at most this many games are drawn individually
+SPARSE_CELL = 2
+
+# Upper bound on individually drawn outliers
+MAX_OUTLIERS = 5000
+
+
+def _axis_values(values, log):
+    """Values on the plotting scale (log10 for log axes; non-positive -> NaN)"""
+    values = np.asarray(values, dtype=float)
+    if log:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(values > 0, np.log10(values), np.nan)
+    return values
+
+
+def density_plan(x, y, log_x=False, log_y=False, threshold=POINT_THRESHOLD, bins=GRID_BINS):
+    """How to draw a scatter of x against y
+
+    Returns {'mode': 'points', 'points': positions} when the point count is
+    at most threshold, else {'mode': 'density', 'x_edges', 'y_edges',
+    'counts', 'points'} where points are the positions of sparse-cell
+    outliers. Edges are on the plotting scale (log10 for log axes).
+    """
+    px_, py_ = _axis_values(x, log_x), _axis_values(y, log_y)
+    valid = np.flatnonzero(np.isfinite(px_) & np.isfinite(py_))
+    if len(valid) <= threshold:
+        return {'mode': 'points', 'points': valid}
+
+    counts, x_edges, y_edges = np.histogram2d(px_[valid], py_[valid], bins=bins)
+    # Cell of every point, so sparse cells can be mapped back to rows
+    xi = np.clip(np.searchsorted(x_edges, px_[valid], side='right') - 1, 0, bins - 1)
+    yi = np.clip(np.searchsorted(y_edges, py_[valid], side='right') - 1, 0, bins - 1)
+    cell_counts = counts[xi, yi]
+
+    sparse = np.flatnonzero(cell_counts <= SPARSE_CELL)
+    if len(sparse) > MAX_OUTLIERS:
+        # Keep the loneliest points first
+        sparse = sparse[np.argsort(cell_counts[sparse], kind='stable')[:MAX_OUTLIERS]]
+    return {
+        'mode': 'density',
+        'x_edges': x_edges,
+        'y_edges': y_edges,
+        'counts': counts.T,  # (y, x) as heatmaps expect
+        'points': np.sort(valid[sparse])
+    }
+
+
+class ScatterPlanner:
+    """Cached density plans for scatter charts over the columns of one frame"""
+
+    def __init__(self, df, cache=None, threshold=POINT_THRESHOLD):
+        self.df = df
+        self.cache = cache if cache is not None else ResultCache()
+        self.threshold = threshold
+
+    def plan(self, x, y, rows=None, filters=None, log_x=False, log_y=False):
+        """density_plan for columns x and y over rows, with positions mapped back to frame rows"""
+        key = {'kind': 'scatter', 'x': x, 'y': y, 'log_x': log_x, 'log_y': log_y,
+               'threshold': self.threshold, 'filters': filter_key(filters or {})}
+
+        def compute():
+            x_values = self.df[x].to_numpy(dtype=float)
+            y_values = self.df[y].to_numpy(dtype=float)
+            if rows is not None:
+                x_values, y_values = x_values[rows], y_values[rows]
+            plan = density_plan(x_values, y_values, log_x, log_y, self.threshold)
+            if rows is not None:
+                plan['points'] = np.asarray(rows)[plan['points']]
+            return plan
+        return self.cache.get_or_compute(key, compute)
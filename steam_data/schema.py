@@ -0,0 +1,60 @@
+"""
+DATASET SCHEMA
+Explicit, memory-compact dtypes for the prepared dataset: categories for
+repeated strings, Arrow-backed strings for free text, downcast numerics and
+bool platform flags. scripts/data_preparation/memory_report.py prints the
+bytes per column before and after
+"""
+
+import numpy as np
+import pandas as pd
+
+# Strings repeated across many games
+CATEGORY_COLUMNS = ['Developers', 'Publishers', 'Main_Developer', 'Genres', 'Categories', 'Estimated owners']
+
+# Free text, stored as Arrow strings (any other object column is treated the same)
+TEXT_COLUMNS = ['Name', 'About the game', 'Tags']
+
+BOOL_COLUMNS = ['Windows', 'Mac', 'Linux']
+
+# Prices, rates and years stay exact enough in float32
+FLOAT32_COLUMNS = ['Price', 'positive_rate', 'Release_Year']
+
+# Columns that already have a compact Arrow type
+OBJECT_COLUMNS = ['genre_list']
+
+
+def apply_schema(df):
+    """Frame with the compact dtypes (columns not present are skipped)"""
+    df = df.copy()
+    for col in df.columns:
+        series = df[col]
+        if col in OBJECT_COLUMNS:
+            continue
+        if col in CATEGORY_COLUMNS:
+            df[col] = series.astype('category')
+        elif col in BOOL_COLUMNS:
+            df[col] = series.fillna(False).astype(bool)
+        elif col in FLOAT32_COLUMNS:
+            df[col] = series.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            df[col] = pd.to_numeric(series, downcast='integer')
+        elif series.dtype == object or pd.api.types.is_string_dtype(series):
+            df[col] = series.astype('string[pyarrow]')
+    return df
+
+
+def memory_report(before, after):
+    """Bytes and dtype per column before and after apply_schema"""
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'bytes_before': before.memory_usage(deep=True, index=False),
+        'dtype_after': after.dtypes.astype(str),
+        'bytes_after': after.memory_usage(deep=True, index=False)
+    })
+    report['saved'] = 1 - report['bytes_after'] / report['bytes_before']
+    report.loc['TOTAL'] = [
+        '', report['bytes_before'].sum(), '', report['bytes_after'].sum(),
+        1 - report['bytes_after'].sum() / report['bytes_before'].sum()
+    ]
+    return report
@@ -0,0 +1,82 @@
+"""
+SIMILAR GAMES INDEX
+k-nearest-neighbour search over normalized game features (price, rating,
+playtime, release year, platform count) with configurable weights and an
+optional genre block (Jaccard distance from the sparse genre matrix).
+Queries are one batched NumPy distance pass plus argpartition, and never
+touch the shared DataFrame
+"""
+
+import numpy as np
+import pandas as pd
+
+# Feature -> default weight (mirrors the original hand-tuned similarity score)
+DEFAULT_WEIGHTS = {
+    'Price': 0.2,
+    'positive_rate': 0.3,
+    'Median playtime forever': 0.2,
+    'Release_Year': 0.1,
+    'platform_count': 0.2,
+}
+
+# Heavy-tailed features are compared on a log scale
+LOG_FEATURES = ['Price', 'Median playtime forever']
+
+
+class SimilarityIndex:
+    """Weighted nearest neighbours over standardized feature vectors"""
+
+    def __init__(self, df, genre_index=None, features=None):
+        self.features = list(features or DEFAULT_WEIGHTS)
+        values = df[self.features].astype(float)
+        for col in LOG_FEATURES:
+            if col in values:
+                values[col] = np.log1p(values[col].clip(lower=0))
+        values = values.fillna(values.median())
+
+        std = values.std().replace(0, 1)
+        self.matrix = ((values - values.mean()) / std).to_numpy(dtype=np.float32)
+        self.genre_index = genre_index
+        if genre_index is not None:
+            self._genres_by_game = genre_index.incidence.T.tocsr()
+            self._genre_counts = np.asarray(genre_index.incidence.sum(axis=0)).ravel()
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def distances(self, row, weights=None, genre_weight=0.0):
+        """Weighted squared distance from game `row` to every game"""
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        w = np.array([weights.get(col, 0.0) for col in self.features], dtype=np.float32)
+
+        diff = self.matrix - self.matrix[row]
+        dist = (diff * diff) @ w
+
+        if genre_weight and self.genre_index is not None:
+            # Jaccard distance between genre sets via one sparse mat-vec
+            ref_genres = self._genres_by_game[row].toarray().ravel()
+            overlap = self._genres_by_game @ ref_genres
+            union = self._genre_counts + ref_genres.sum() - overlap
+            with np.errstate(invalid='ignore', divide='ignore'):
+                jaccard = np.where(union > 0, 1 - overlap / union, 0.0)
+            dist = dist + genre_weight * jaccard
+
+        return dist
+
+    def neighbors(self, row, k=10, weights=None, genre_weight=0.0, exclude=None):
+        """Top-k most similar games as a DataFrame of row, distance and similarity"""
+        dist = self.distances(row, weights, genre_weight)
+        dist[row] = np.inf
+        if exclude is not None:
+            dist[exclude] = np.inf
+
+        k = min(k, int(np.isfinite(dist).sum()))
+        if k <= 0:
+            return pd.DataFrame({'row': [], 'distance': [], 'similarity': []})
+        top = np.argpartition(dist, k - 1)[:k]
+        top = top[np.argsort(dist[top], kind='stable')]
+        return pd.DataFrame({
+            'row': top,
+            'distance': dist[top],
+            'similarity': 1 / (1 + np.sqrt(dist[top]))
+        })
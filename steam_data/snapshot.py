@@ -0,0 +1,101 @@
+"""
+DATASET SNAPSHOT CACHE
+Persists the fully derived dataset as an Arrow IPC (Feather) file keyed by
+the hash of the source CSV, so cold starts skip CSV parsing and derivation
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from .dataset import RAW_CSV, read_raw_dataset
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = 'data/cache'
+
+# Bump whenever prepare_dataset() changes so old snapshots are rebuilt
+SNAPSHOT_VERSION = 3
+
+
+def source_digest(csv_path):
+    """SHA-256 of the source file, memoized on (size, mtime) in a sidecar"""
+    csv_path = Path(csv_path)
+    stat = csv_path.stat()
+    sidecar = csv_path.with_name(csv_path.name + '.sha256.json')
+
+    try:
+        memo = json.loads(sidecar.read_text())
+        if memo['size'] == stat.st_size and memo['mtime_ns'] == stat.st_mtime_ns:
+            return memo['sha256']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    digest = digest.hexdigest()
+
+    try:
+        sidecar.write_text(json.dumps({
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest
+        }))
+    except OSError:
+        pass  # read-only data dir, just rehash next time
+    return digest
+
+
+def snapshot_path(csv_path, snapshot_dir=SNAPSHOT_DIR):
+    """Snapshot file for the current contents of csv_path"""
+    key = f"{source_digest(csv_path)[:16]}.v{SNAPSHOT_VERSION}"
+    return Path(snapshot_dir) / f"{Path(csv_path).stem}.{key}.arrow"
+
+
+def _read_snapshot(path):
+    table = feather.read_table(path, memory_map=True)
+    # One block per column lets numeric columns point straight into the
+    # memory map (read-only, and shared with other processes via the page cache).
+    # List columns (genre_list) stay Arrow-backed instead of becoming Python lists
+    return table.to_pandas(
+        split_blocks=True,
+        types_mapper=lambda arrow_type: pd.ArrowDtype(arrow_type) if pa.types.is_list(arrow_type) else None
+    )
+
+
+def _write_snapshot(df, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    feather.write_feather(df, tmp_path, compression='uncompressed')
+    # Atomic so concurrent workers never see a half-written snapshot
+    os.replace(tmp_path, path)
+
+    # Drop snapshots of older versions of the same source file
+    for stale in path.parent.glob(f"{path.name.split('.')[0]}.*.arrow"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+
+def load_snapshot(csv_path=RAW_CSV, build=read_raw_dataset, snapshot_dir=SNAPSHOT_DIR):
+    """Return (df, status) where status is 'hit' or 'miss'"""
+    path = snapshot_path(csv_path, snapshot_dir)
+    if path.exists():
+        try:
+            df = _read_snapshot(path)
+            logger.debug("Snapshot hit: %s", path)
+            return df, 'hit'
+        except (OSError, pa.ArrowException):
+            pass  # corrupt or truncated, rebuild below
+
+    df = build(csv_path)
+    _write_snapshot(df.reset_index(drop=True), path)
+    logger.info("Snapshot miss: rebuilt %s from %s", path, csv_path)
+    return df, 'miss'
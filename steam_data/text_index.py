@@ -0,0 +1,107 @@
+"""
+TRIGRAM SUBSTRING INDEX
+Inverted index from case-folded character trigrams to row positions. A
+substring query intersects the posting lists of its trigrams (smallest
+first) and only verifies the few surviving candidates. Queries too short to
+have a trigram are matched by one vectorized Arrow scan, memoized per query
+(there are only so many 1-2 character strings). A sorted copy of the texts
+answers prefix lookups
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Sorts after every character a text can continue with
+_MAX_CHAR = '\U0010ffff'
+
+
+def trigrams(text):
+    """Set of character trigrams of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Case-insensitive substring search over one text column"""
+
+    def __init__(self, texts):
+        self.texts = [str(t).casefold() if isinstance(t, str) else '' for t in texts]
+
+        grams, rows = [], []
+        for row, text in enumerate(self.texts):
+            text_grams = trigrams(text)
+            grams.extend(text_grams)
+            rows.extend([row] * len(text_grams))
+
+        # Posting lists stored CSR-style: rows of gram g are postings[offsets[g]:offsets[g + 1]]
+        codes, vocab = pd.factorize(pd.Series(grams, dtype=object))
+        order = np.argsort(codes, kind='stable')
+        self.postings = np.asarray(rows, dtype=np.int32)[order]
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(vocab)))])
+        self._gram_id = {gram: i for i, gram in enumerate(vocab)}
+
+        # Sorted texts for prefix lookups (short queries)
+        order = sorted(range(len(self.texts)), key=self.texts.__getitem__)
+        self._sorted_texts = [self.texts[i] for i in order]
+        self._sorted_rows = np.asarray(order, dtype=np.int32)
+
+        self._arrow_texts = pa.array(self.texts, type=pa.string())
+        self._short_hits = {}  # 1-2 character query -> rows containing it
+
+    @classmethod
+    def from_series(cls, series):
+        return cls(series.tolist())
+
+    def __len__(self):
+        return len(self.texts)
+
+    def posting(self, gram):
+        """Row positions whose text contains gram (None if unseen)"""
+        gram_id = self._gram_id.get(gram)
+        if gram_id is None:
+            return None
+        return self.postings[self.offsets[gram_id]:self.offsets[gram_id + 1]]
+
+    def candidates(self, query):
+        """Rows containing every trigram of the query (a superset of the matches)"""
+        postings = []
+        for gram in trigrams(query):
+            posting = self.posting(gram)
+            if posting is None:
+                return np.array([], dtype=np.int32)
+            postings.append(posting)
+
+        postings.sort(key=len)
+        result = postings[0]
+        for posting in postings[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, posting, assume_unique=True)
+        return result
+
+    def prefix(self, query):
+        """Sorted row positions whose text starts with query (case-insensitive)"""
+        query = query.casefold()
+        lo = bisect_left(self._sorted_texts, query)
+        hi = bisect_left(self._sorted_texts, query + _MAX_CHAR)
+        return np.sort(self._sorted_rows[lo:hi])
+
+    def _short_search(self, query):
+        """Rows containing a query shorter than a trigram (one C-level scan per distinct query)"""
+        hits = self._short_hits.get(query)
+        if hits is None:
+            matched = pc.match_substring(self._arrow_texts, query)
+            hits = np.flatnonzero(np.asarray(matched, dtype=bool)).astype(np.int32)
+            self._short_hits[query] = hits
+        return hits
+
+    def search(self, query):
+        """Sorted row positions whose text contains query (case-insensitive)"""
+        query = query.casefold()
+        if len(query) < 3:
+            return self._short_search(query)
+
+        return np.array([i for i in self.candidates(query) if query in self.texts[i]], dtype=np.int32)